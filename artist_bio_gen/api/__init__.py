@@ -26,6 +26,7 @@ from .quota import (
     should_pause_processing,
     QuotaMonitor,
     PauseController,
+    TokenBucket,
 )
 
 __all__ = [
@@ -43,4 +44,5 @@ __all__ = [
     "should_pause_processing",
     "QuotaMonitor",
     "PauseController",
+    "TokenBucket",
 ]
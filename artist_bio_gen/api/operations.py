@@ -7,19 +7,18 @@ for the artist bio generator application.
 
 import logging
 import time
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from ..core.pipeline import ResponseProcessor, RequestContext
+from ..core.resources import ConcurrencyThrottle
+from ..database.batch import BioUpdateBatcher
+from ..database.connection import ConnectionPool
 from ..models import ArtistData, ApiResponse
 from .utils import retry_with_exponential_backoff
 from .quota import QuotaMonitor, PauseController
 
-try:
+if TYPE_CHECKING:
     from openai import OpenAI
-    import psycopg3
-except ImportError:
-    OpenAI = None
-    psycopg3 = None
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +36,8 @@ def call_openai_api(
     quota_monitor: Optional[QuotaMonitor] = None,
     pause_controller: Optional[PauseController] = None,
     output_path: Optional[str] = None,
+    throttle: Optional[ConcurrencyThrottle] = None,
+    bio_batcher: Optional[BioUpdateBatcher] = None,
 ) -> Tuple[ApiResponse, float]:
     """
     Make an API call to OpenAI Responses API for a single artist and optionally update database.
@@ -53,6 +54,8 @@ def call_openai_api(
         quota_monitor: Optional quota monitor instance
         pause_controller: Optional pause controller instance
         output_path: Optional path to stream JSONL output
+        throttle: Optional concurrency throttle fed with DB connection waits
+        bio_batcher: Optional group-commit batcher used instead of per-row DB writes
 
     Returns:
         Tuple of (ApiResponse with the result or error information, duration in seconds)
@@ -71,6 +74,8 @@ def call_openai_api(
         db_pool=db_pool,
         quota_monitor=quota_monitor,
         pause_controller=pause_controller,
+        throttle=throttle,
+        bio_batcher=bio_batcher,
     )
 
     # Create response processor with configured components
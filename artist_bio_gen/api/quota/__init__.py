@@ -9,6 +9,7 @@ The package is organized into focused modules:
 - parsing: Header parsing and usage metrics calculation
 - monitor: Thread-safe quota monitoring
 - controller: Pause/resume controller with events
+- rate_limiter: Client-side token bucket request pacing
 
 All public APIs are re-exported here for backward compatibility.
 """
@@ -21,6 +22,7 @@ from .parsing import (
 )
 from .monitor import QuotaMonitor
 from .controller import PauseController
+from .rate_limiter import TokenBucket
 
 # Re-export for backward compatibility
 __all__ = [
@@ -31,4 +33,5 @@ __all__ = [
     # Classes
     "QuotaMonitor",
     "PauseController",
+    "TokenBucket",
 ]
\ No newline at end of file
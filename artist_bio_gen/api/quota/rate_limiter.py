@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Module
+
+Thread-safe client-side token bucket that paces request submission to
+stay under OpenAI requests-per-minute and tokens-per-minute limits.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for proactive request pacing.
+
+    Request and token budgets refill continuously at ``rpm / 60`` and
+    ``tpm / 60`` per second. Each acquire() reserves its share up front
+    and sleeps off any deficit outside the lock, so concurrent callers
+    are spaced out evenly instead of bursting into 429 responses.
+    """
+
+    def __init__(
+        self,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize token bucket.
+
+        Args:
+            rpm: Requests per minute allowed (None disables request pacing)
+            tpm: Tokens per minute allowed (None disables token pacing)
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if rpm is not None and rpm <= 0:
+            raise ValueError(f"rpm must be positive, got {rpm}")
+        if tpm is not None and tpm <= 0:
+            raise ValueError(f"tpm must be positive, got {tpm}")
+
+        self.rpm = rpm
+        self.tpm = tpm
+        self._clock = clock
+        self._sleep = sleep
+
+        # Allow at most one second worth of burst; rates are 0.0 when disabled
+        self._request_rate = rpm / 60.0 if rpm else 0.0
+        self._request_capacity = max(1.0, self._request_rate) if rpm else 0.0
+        self._token_rate = tpm / 60.0 if tpm else 0.0
+        self._token_capacity = self._token_rate
+
+        self._requests = self._request_capacity
+        self._tokens = self._token_capacity
+        self._last = clock()
+        self._lock = threading.Lock()
+
+        logger.info(f"TokenBucket initialized: rpm={rpm}, tpm={tpm}")
+
+    def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        Reserve one request (and estimated tokens), blocking until allowed.
+
+        Args:
+            estimated_tokens: Expected tokens the request will consume
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._last)
+            self._last = now
+
+            wait = 0.0
+            if self.rpm:
+                self._requests = min(
+                    self._request_capacity,
+                    self._requests + elapsed * self._request_rate,
+                )
+                self._requests -= 1.0
+                if self._requests < 0:
+                    wait = -self._requests / self._request_rate
+
+            if self.tpm:
+                self._tokens = min(
+                    self._token_capacity, self._tokens + elapsed * self._token_rate
+                )
+                self._tokens -= max(0, estimated_tokens)
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._token_rate)
+
+        if wait > 0:
+            logger.debug(f"Rate limiter delaying submission by {wait:.2f}s")
+            self._sleep(wait)
+
+        return wait
@@ -11,6 +11,7 @@ import sys
 import time
 
 from ..constants import (
+    BATCHED_WRITE_POOL_SIZE,
     EXIT_CONFIG_ERROR,
     EXIT_INPUT_ERROR,
     EXIT_API_FAILURES,
@@ -53,6 +54,26 @@ from ..config.schema import ConfigSchema
 logger = logging.getLogger(__name__)
 
 
+def _database_pool_size(max_workers: int, db_batch_size: int) -> int:
+    """
+    Size the base connection pool for the configured write mode.
+
+    Group commit (db_batch_size > 1) borrows connections only from the
+    batcher thread and, for cached hits, the main thread. Per-row writes
+    borrow one connection per worker around each UPDATE.
+
+    Args:
+        max_workers: Number of concurrent API workers
+        db_batch_size: Bio updates committed per database transaction
+
+    Returns:
+        Number of base connections for the pool
+    """
+    if db_batch_size > 1:
+        return BATCHED_WRITE_POOL_SIZE
+    return max_workers
+
+
 def main():
     """Main entry point for the script."""
     parser = create_argument_parser()
@@ -76,6 +97,8 @@ def main():
             DAILY_REQUEST_LIMIT=config.daily_request_limit,
             PAUSE_DURATION_HOURS=config.pause_duration_hours,
             QUOTA_LOG_INTERVAL=config.quota_log_interval,
+            RATE_LIMIT_RPM=config.rate_limit_rpm,
+            RATE_LIMIT_TPM=config.rate_limit_tpm,
         )
 
         # Set the global env instance for components that use Env.current()
@@ -140,15 +163,25 @@ def main():
                 sys.exit(EXIT_INPUT_ERROR)
 
         # Initialize OpenAI client
-        client = create_openai_client()
+        client = create_openai_client(http2=args.openai_http2)
 
         # Initialize database connection if enabled
         db_pool = None
         if args.enable_db:
             try:
-                # Use database URL from environment configuration
-                db_config = create_database_config(url=env.DATABASE_URL, test_mode=args.test_mode)
-                db_pool = create_db_connection_pool(db_config)
+                # Use database URL from environment configuration, sizing the
+                # pool for the write mode plus a little headroom
+                db_config = create_database_config(
+                    url=env.DATABASE_URL,
+                    pool_size=_database_pool_size(args.max_workers, args.db_batch_size),
+                    max_overflow=2,
+                    test_mode=args.test_mode,
+                    synchronous_commit=not args.db_async_commit,
+                )
+                # Only per-row writes borrow a connection per worker up front
+                db_pool = create_db_connection_pool(
+                    db_config, prewarm=args.db_batch_size <= 1
+                )
                 logger.info(f"Database connection initialized {'(test mode)' if args.test_mode else ''}")
             except Exception as e:
                 logger.error(f"Failed to initialize database connection: {e}")
@@ -177,6 +210,12 @@ def main():
                 daily_request_limit=env.DAILY_REQUEST_LIMIT,
                 quota_threshold=env.QUOTA_THRESHOLD,
                 quota_monitoring=env.QUOTA_MONITORING,
+                cache_path=args.cache_path,
+                cache_policy=args.cache_policy,
+                rate_limit_rpm=env.RATE_LIMIT_RPM,
+                rate_limit_tpm=env.RATE_LIMIT_TPM,
+                db_batch_size=args.db_batch_size,
+                print_responses=args.print_responses,
             )
 
             logger.info(f"Streaming output completed: {args.output}")
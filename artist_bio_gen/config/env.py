@@ -45,6 +45,8 @@ class Env:
     DAILY_REQUEST_LIMIT: Optional[int] = None
     PAUSE_DURATION_HOURS: int = 24
     QUOTA_LOG_INTERVAL: int = 100
+    RATE_LIMIT_RPM: Optional[int] = None
+    RATE_LIMIT_TPM: Optional[int] = None
 
     @staticmethod
     def load(cli_overrides: Optional[Mapping[str, str]] = None) -> "Env":
@@ -82,6 +84,8 @@ class Env:
                 DAILY_REQUEST_LIMIT=config.daily_request_limit,
                 PAUSE_DURATION_HOURS=config.pause_duration_hours,
                 QUOTA_LOG_INTERVAL=config.quota_log_interval,
+                RATE_LIMIT_RPM=config.rate_limit_rpm,
+                RATE_LIMIT_TPM=config.rate_limit_tpm,
             )
 
             logger.debug("Environment configuration loaded successfully")
@@ -150,6 +154,10 @@ class Env:
 
         pause_duration = int(mapping.get("PAUSE_DURATION_HOURS", "24"))
         quota_log_interval = int(mapping.get("QUOTA_LOG_INTERVAL", "100"))
+        rate_limit_rpm_raw = mapping.get("RATE_LIMIT_RPM")
+        rate_limit_rpm = int(rate_limit_rpm_raw) if rate_limit_rpm_raw else None
+        rate_limit_tpm_raw = mapping.get("RATE_LIMIT_TPM")
+        rate_limit_tpm = int(rate_limit_tpm_raw) if rate_limit_tpm_raw else None
 
         # Validate required fields
         missing_required = []
@@ -170,6 +178,8 @@ class Env:
             DAILY_REQUEST_LIMIT=daily_limit,
             PAUSE_DURATION_HOURS=pause_duration,
             QUOTA_LOG_INTERVAL=quota_log_interval,
+            RATE_LIMIT_RPM=rate_limit_rpm,
+            RATE_LIMIT_TPM=rate_limit_tpm,
         )
 
     def mask(self) -> dict:
@@ -12,6 +12,7 @@ from argparse import ArgumentParser, Namespace
 
 from pydantic import ValidationError
 
+from ..constants import DEFAULT_DB_BATCH_SIZE
 from .schema import ConfigSchema
 
 
@@ -184,11 +185,52 @@ Examples:
             action="store_true",
             help="Use test_artists table instead of artists table",
         )
+        parser.add_argument(
+            "--db-batch-size",
+            type=int,
+            default=DEFAULT_DB_BATCH_SIZE,
+            help=(
+                "Bio updates committed per database transaction; 1 writes each bio "
+                f"separately and throttles workers on pool waits instead (default: {DEFAULT_DB_BATCH_SIZE})"
+            ),
+        )
+        parser.add_argument(
+            "--db-async-commit",
+            action="store_true",
+            help=(
+                "Commit bio updates without waiting for the database WAL flush; "
+                "faster, but a database crash can lose the most recent updates"
+            ),
+        )
+        parser.add_argument(
+            "--openai-http2",
+            action="store_true",
+            help=(
+                "Multiplex OpenAI requests over one HTTP/2 connection "
+                '(requires: pip install "httpx[http2]")'
+            ),
+        )
         parser.add_argument(
             "--resume",
             action="store_true",
             help="Resume processing by skipping artists already present in output file",
         )
+        parser.add_argument(
+            "--no-print-responses",
+            dest="print_responses",
+            action="store_false",
+            help="Do not echo generated bios to stdout (JSONL output is unaffected)",
+        )
+        parser.add_argument(
+            "--cache-path",
+            help="SQLite response cache path; cached artists skip the API (optional)",
+        )
+        parser.add_argument(
+            "--cache-policy",
+            choices=["enabled", "read-only", "replay", "disabled"],
+            default="enabled",
+            help="Response cache policy when --cache-path is set (default: enabled)",
+        )
 
         # Add schema-based arguments
         for field_name, field_info in schema.model_fields.items():
@@ -113,6 +113,26 @@ class ConfigSchema(BaseModel):
         }
     )
 
+    rate_limit_rpm: Optional[int] = Field(
+        None,
+        gt=0,
+        description="Client-side requests-per-minute cap applied before each submission",
+        json_schema_extra={
+            "env_var": "RATE_LIMIT_RPM",
+            "cli_arg": "rate_limit_rpm",
+        }
+    )
+
+    rate_limit_tpm: Optional[int] = Field(
+        None,
+        gt=0,
+        description="Client-side tokens-per-minute cap applied before each submission",
+        json_schema_extra={
+            "env_var": "RATE_LIMIT_TPM",
+            "cli_arg": "rate_limit_tpm",
+        }
+    )
+
     @field_validator('quota_monitoring', mode='before')
     @classmethod
     def parse_bool(cls, v: Any) -> bool:
@@ -19,3 +19,13 @@ DEFAULT_POOL_SIZE = 4  # Match default worker count
 DEFAULT_MAX_OVERFLOW = 8  # Allow burst connections
 DEFAULT_CONNECTION_TIMEOUT = 30  # seconds
 DEFAULT_QUERY_TIMEOUT = 60  # seconds
+DEFAULT_CONNECT_TIMEOUT = 10  # seconds to establish a new server connection
+# Group commit writes from one batcher thread (plus the main thread for
+# cached hits), so batched runs need only this many base connections
+BATCHED_WRITE_POOL_SIZE = 2
+
+# Client-side rate limiting constants
+DEFAULT_ESTIMATED_TOKENS_PER_REQUEST = 1000  # Reserved per request when pacing by TPM
+
+# Database write batching
+DEFAULT_DB_BATCH_SIZE = 50  # Bio updates per group commit; 1 disables batching
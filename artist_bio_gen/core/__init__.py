@@ -15,6 +15,13 @@ from .output import (
     append_jsonl_response,
     initialize_jsonl_output,
     get_processed_artist_ids,
+    serialize_jsonl_response,
+    JsonlWriter,
+)
+
+from .cache import (
+    ResponseCache,
+    CACHE_POLICIES,
 )
 
 from .processor import (
@@ -33,6 +40,11 @@ __all__ = [
     "append_jsonl_response", 
     "initialize_jsonl_output",
     "get_processed_artist_ids",
+    "serialize_jsonl_response",
+    "JsonlWriter",
+    # Response cache
+    "ResponseCache",
+    "CACHE_POLICIES",
     # Processing coordination
     "process_artists_concurrent",
     "log_progress_update",
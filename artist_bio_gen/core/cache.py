@@ -0,0 +1,190 @@
+"""
+Response cache module.
+
+This module provides an on-disk cache of successful API responses so that
+reruns, resumes and test harnesses can skip repeat OpenAI calls for artists
+whose request payload has not changed.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from ..models import ApiResponse, ArtistData
+
+logger = logging.getLogger(__name__)
+
+# enabled:   serve hits and store new responses
+# read-only: serve hits, never store
+# replay:    serve hits, fail misses without calling the API
+# disabled:  bypass the cache entirely
+CACHE_POLICIES = ("enabled", "read-only", "replay", "disabled")
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of successful API responses.
+
+    Entries are keyed by a SHA256 digest of the prompt and artist payload,
+    so any change to the prompt ID, version or artist data is a miss.
+    The database runs in WAL mode and is safe to share between threads.
+    """
+
+    def __init__(self, path: str, policy: str = "enabled"):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite cache file
+            policy: One of CACHE_POLICIES
+
+        Raises:
+            ValueError: If the policy is unknown
+        """
+        if policy not in CACHE_POLICIES:
+            raise ValueError(
+                f"Invalid cache policy '{policy}'. Must be one of: {', '.join(CACHE_POLICIES)}"
+            )
+
+        self.path = path
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if policy == "disabled":
+            return
+
+        cache_dir = os.path.dirname(path)
+        if cache_dir and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response_text TEXT NOT NULL,
+                response_id TEXT NOT NULL,
+                created INTEGER NOT NULL,
+                stored_at REAL NOT NULL
+            )
+            """)
+        self._conn.commit()
+        logger.info(f"Opened response cache: {path} (policy: {policy})")
+
+    @property
+    def readable(self) -> bool:
+        """Whether lookups are served from the cache."""
+        return self._conn is not None
+
+    @property
+    def writable(self) -> bool:
+        """Whether new responses are stored in the cache."""
+        return self._conn is not None and self.policy == "enabled"
+
+    @property
+    def replay_only(self) -> bool:
+        """Whether cache misses must not reach the API."""
+        return self.policy == "replay"
+
+    @staticmethod
+    def make_key(prompt_id: str, version: Optional[str], artist: ArtistData) -> str:
+        """
+        Build the deterministic cache key for a request.
+
+        Args:
+            prompt_id: OpenAI prompt ID
+            version: Optional prompt version
+            artist: Artist being processed
+
+        Returns:
+            Hex SHA256 digest of the request payload
+        """
+        payload = (
+            f"{prompt_id}|{version}|{artist.artist_id}|{artist.name}|{artist.data}"
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, artist: ArtistData) -> Optional[ApiResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+            artist: Artist the response belongs to
+
+        Returns:
+            ApiResponse rebuilt from the cache, or None on a miss
+        """
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT response_text, response_id, created FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        response_text, response_id, created = row
+        return ApiResponse(
+            artist_id=artist.artist_id,
+            artist_name=artist.name,
+            artist_data=artist.data,
+            response_text=response_text,
+            response_id=response_id,
+            created=created,
+            db_status="null",
+            error=None,
+        )
+
+    def put(self, key: str, response: ApiResponse) -> None:
+        """
+        Store a successful response.
+
+        Args:
+            key: Cache key from make_key()
+            response: Response to store (ignored if the API call or the
+                database write failed, so a rerun retries it)
+        """
+        if self.policy != "enabled" or response.error or response.db_status == "error":
+            return
+
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, response_text, response_id, created, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.response_text,
+                    response.response_id,
+                    response.created,
+                    time.time(),
+                ),
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> "ResponseCache":
+        """Enter context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the cache on exit."""
+        self.close()
@@ -6,25 +6,50 @@ processing without direct resource management concerns.
 """
 
 import logging
+import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from functools import partial
+from typing import TYPE_CHECKING, ContextManager, Iterable, List, Optional, Sized, Tuple
 
 from ..models import ArtistData, ApiResponse
 from ..api import call_openai_api
-from .output import append_jsonl_response
-from .resources import ProcessingContext, ResourceCoordinator, TimerManager
+from ..constants import DEFAULT_ESTIMATED_TOKENS_PER_REQUEST
+from ..database import (
+    cancel_retry_backoff,
+    canonical_uuid,
+    get_db_connection,
+    release_db_connection,
+    reset_retry_backoff,
+    update_artist_bios_batch,
+)
+from .output import JsonlWriter, append_jsonl_response
+from .resources import ConcurrencyThrottle, ProcessingContext, ResourceCoordinator, TimerManager
 from .progress import ProgressTracker
 
-try:
+if TYPE_CHECKING:
     from openai import OpenAI
-except ImportError:
-    OpenAI = None
 
 logger = logging.getLogger(__name__)
 
+# Echoed bios are written to stdout in groups of this many lines
+_STDOUT_BATCH_SIZE = 32
+
+
+class _ThrottleRelease:
+    """Done callback that returns a throttle permit when a task finishes."""
+
+    __slots__ = ("throttle",)
+
+    def __init__(self, throttle: ConcurrencyThrottle):
+        self.throttle = throttle
+
+    def __call__(self, future: Future) -> None:
+        self.throttle.release()
+
 
 class ProcessingOrchestrator:
     """
@@ -41,6 +66,8 @@ class ProcessingOrchestrator:
         version: Optional[str],
         max_workers: int,
         test_mode: bool = False,
+        quota_check_interval: int = 10,
+        print_responses: bool = True,
     ):
         """
         Initialize processing orchestrator.
@@ -51,36 +78,83 @@ class ProcessingOrchestrator:
             version: Optional prompt version
             max_workers: Maximum number of concurrent workers
             test_mode: If True, use test_artists table
+            quota_check_interval: Check for a quota pause every N successes
+            print_responses: If True, echo each successful bio to stdout
         """
         self.context = context
         self.prompt_id = prompt_id
         self.version = version
         self.max_workers = max_workers
+        # Worker labels are reused round-robin instead of formatted per task
+        self._worker_ids = tuple(f"W{k + 1:02d}" for k in range(max_workers))
         self.test_mode = test_mode
         self.resource_coordinator = ResourceCoordinator(context)
         self.timer_manager = TimerManager()
-
-    def process_artists(self, artists: List[ArtistData]) -> Tuple[int, int]:
+        self._writer: Optional[JsonlWriter] = None
+        self.quota_check_interval = max(1, quota_check_interval)
+        self.print_responses = print_responses
+        self._stdout_lines: List[str] = []
+        # Primed so the first success is checked; small runs still pause promptly
+        self._successes_since_quota_check = self.quota_check_interval - 1
+
+    def process_artists(
+        self,
+        artists: Iterable[ArtistData],
+        total_artists: Optional[int] = None,
+    ) -> Tuple[int, int]:
         """
-        Process a list of artists concurrently.
+        Process artists concurrently.
+
+        Artists are pulled from the iterable only as in-flight slots free
+        up, so a generator is consumed with memory proportional to the
+        worker count rather than the input size.
 
         Args:
-            artists: List of artists to process
+            artists: Artists to process (list or any iterable, e.g. a generator)
+            total_artists: Number of artists for progress reporting; defaults
+                to len(artists) when the iterable is sized
 
         Returns:
             Tuple of (successful_calls, failed_calls)
         """
-        # Initialize progress tracker
-        tracker = ProgressTracker(len(artists))
-
-        logger.info(f"Starting concurrent processing with {self.max_workers} workers")
+        if total_artists is None:
+            total_artists = len(artists) if isinstance(artists, Sized) else 0
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            futures = self._submit_tasks(executor, artists)
+        # Initialize progress tracker
+        # Per-artist success lines only with --verbose; failures always log
+        tracker = ProgressTracker(
+            total_artists, log_every_item=logger.isEnabledFor(logging.DEBUG)
+        )
 
-            # Process completed tasks
-            self._process_results(futures, tracker)
+        # Single writer thread batches JSONL appends off the result loop. The
+        # context owns it and closes it on exit; a context without one gets
+        # a writer scoped to this run.
+        shared_writer = getattr(self.context, "jsonl_writer", None)
+        if shared_writer is not None:
+            writer_scope: ContextManager[JsonlWriter] = nullcontext(shared_writer)
+        else:
+            writer_scope = JsonlWriter(self.context.output_path)
+
+        with writer_scope as writer:
+            self._writer = writer
+            try:
+                # Answer cached artists without touching the executor
+                artists = self._serve_cached(artists, tracker)
+
+                logger.info(f"Starting concurrent processing with {self.max_workers} workers")
+
+                reset_retry_backoff()
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    try:
+                        self._run_bounded(executor, artists, tracker)
+                    except KeyboardInterrupt:
+                        # Wake workers sleeping in DB retry backoff so the
+                        # executor shutdown below does not wait them out
+                        cancel_retry_backoff()
+                        raise
+            finally:
+                self._writer = None
+                self._flush_stdout()
 
         # Clean up timers
         self.timer_manager.cancel_all()
@@ -94,75 +168,272 @@ class ProcessingOrchestrator:
 
         return successful_calls, failed_calls
 
-    def _submit_tasks(
+    def _serve_cached(
         self,
-        executor: ThreadPoolExecutor,
-        artists: List[ArtistData]
-    ) -> Dict[Future, Tuple[ArtistData, str]]:
+        artists: Iterable[ArtistData],
+        tracker: ProgressTracker
+    ) -> Iterable[ArtistData]:
         """
-        Submit all processing tasks to the executor.
+        Handle artists answered by the response cache.
+
+        Lookups happen up front so hits can be written to the database in
+        one batch; this materializes the misses when a cache is configured.
 
         Args:
-            executor: Thread pool executor
-            artists: List of artists to process
+            artists: Artists to process
+            tracker: Progress tracker
 
         Returns:
-            Dictionary mapping futures to (artist, worker_id) tuples
+            Artists that still need an API call
         """
-        futures = {}
+        cache = self.context.response_cache
+        if cache is None or not cache.readable:
+            return artists
+
+        misses = []
+        hits = []
+        looked_up = 0
+        for artist in artists:
+            looked_up += 1
+            key = cache.make_key(self.prompt_id, self.version, artist)
+            cached = cache.get(key, artist)
+
+            if cached is not None:
+                hits.append((artist, cached))
+                continue
+            elif cache.replay_only:
+                miss_response = ApiResponse(
+                    artist_id=artist.artist_id,
+                    artist_name=artist.name,
+                    artist_data=artist.data,
+                    response_text="",
+                    response_id="",
+                    created=0,
+                    error="Cache miss in replay mode",
+                )
+                self._handle_response(miss_response, artist, "cache", 0.0, tracker)
+            else:
+                misses.append(artist)
+                continue
 
-        for i, artist in enumerate(artists):
-            # Check for pause before submitting new task
-            self.resource_coordinator.wait_if_paused()
+            if tracker.should_log_summary():
+                tracker.log_summary(self.context.get_quota_status_message())
 
-            # Generate worker ID
-            worker_id = f"W{i % self.max_workers + 1:02d}"
+        for artist, cached in self._persist_cached(hits):
+            self._handle_response(cached, artist, "cache", 0.0, tracker)
+            if tracker.should_log_summary():
+                tracker.log_summary(self.context.get_quota_status_message())
 
-            # Submit task
-            future = executor.submit(
-                call_openai_api,
-                self.context.client,
-                artist,
-                self.prompt_id,
-                self.version,
-                worker_id,
-                self.context.db_pool,
-                False,  # skip_existing
-                self.test_mode,
-                self.context.quota_monitor,
-                self.context.pause_controller
-            )
+        logger.info(
+            f"Response cache: {len(hits)} hit(s), {looked_up - len(hits)} miss(es) "
+            f"(policy: {cache.policy})"
+        )
+        return misses
+
+    def _persist_cached(
+        self,
+        hits: List[Tuple[ArtistData, ApiResponse]]
+    ) -> List[Tuple[ArtistData, ApiResponse]]:
+        """
+        Write cached bios to the database in one batch.
+
+        A cache hit skips the API call but must not skip the database,
+        otherwise a bio cached by a run without (or with a failed) DB write
+        would never be stored.
 
-            futures[future] = (artist, worker_id)
+        Args:
+            hits: (artist, cached response) pairs
+
+        Returns:
+            The same pairs with db_status set from the batch outcome
+        """
+        db_pool = self.context.db_pool
+        if db_pool is None or not hits:
+            return hits
+
+        canonical_ids: List[Optional[str]] = []
+        updates = []
+        for artist, cached in hits:
+            # Invalid IDs (None) are reported as errors and never reach the batch
+            canonical_id = canonical_uuid(artist.artist_id)
+            canonical_ids.append(canonical_id)
+            if canonical_id is not None:
+                updates.append((canonical_id, cached.response_text))
+
+        try:
+            connection = get_db_connection(db_pool)
+            if connection is None:
+                raise RuntimeError("Failed to get database connection")
+            try:
+                updated_ids = update_artist_bios_batch(
+                    connection,
+                    updates,
+                    skip_existing=False,
+                    test_mode=self.test_mode,
+                    worker_id="cache",
+                )
+            finally:
+                release_db_connection(db_pool, connection)
+        except Exception as e:
+            logger.error(f"Failed to write {len(updates)} cached bio(s) to the database: {e}")
+            updated_ids = None
+
+        persisted = []
+        for (artist, cached), canonical_id in zip(hits, canonical_ids):
+            if canonical_id is None or updated_ids is None:
+                db_status = "error"
+            elif canonical_id in updated_ids:
+                db_status = "updated"
+            else:
+                db_status = "skipped"
+            persisted.append((artist, cached._replace(db_status=db_status)))
+        return persisted
+
+    def _store_in_cache(self, artist: ArtistData, api_response: ApiResponse) -> None:
+        """Store a fresh successful response in the response cache."""
+        cache = self.context.response_cache
+        if cache is None or not cache.writable:
+            return
 
-        return futures
+        try:
+            cache.put(cache.make_key(self.prompt_id, self.version, artist), api_response)
+        except Exception as e:
+            logger.warning(f"Failed to cache response for '{artist.name}': {e}")
 
-    def _process_results(
+    def _run_bounded(
         self,
-        futures: Dict[Future, Tuple[ArtistData, str]],
+        executor: ThreadPoolExecutor,
+        artists: Iterable[ArtistData],
         tracker: ProgressTracker
     ) -> None:
         """
-        Process results as tasks complete.
+        Submit tasks through a bounded in-flight window.
+
+        At most ``2 * max_workers`` futures exist at any time, so memory
+        stays proportional to the worker count rather than the input size
+        and pause gating takes effect before the remaining artists are
+        submitted. Each result is handled from its future's done callback
+        on the worker thread that finished it; a lock serializes progress
+        tracking and stdout, leaving the main thread to submit only.
 
         Args:
-            futures: Dictionary of futures to process
+            executor: Thread pool executor
+            artists: Artists to process, consumed lazily
             tracker: Progress tracker
         """
-        for future in as_completed(futures):
-            artist, worker_id = futures[future]
+        slots = threading.Semaphore(2 * self.max_workers)
+        result_lock = threading.Lock()
+        idle = threading.Condition()
+        in_flight = 0
+
+        # Bind hot-path callables once rather than per completion
+        submit_task = self._submit_task
+        process_result = self._process_result
 
+        def on_done(future: Future, artist: ArtistData, worker_id: str) -> None:
+            nonlocal in_flight
             try:
-                api_response, duration = future.result()
-                self._handle_response(api_response, artist, worker_id, duration, tracker)
+                with result_lock:
+                    process_result(future, artist, worker_id, tracker)
+            finally:
+                slots.release()
+                with idle:
+                    in_flight -= 1
+                    idle.notify()
 
-            except Exception as e:
-                self._handle_exception(e, artist, worker_id, tracker)
+        for i, artist in enumerate(artists):
+            slots.acquire()
+            future, worker_id = submit_task(executor, i, artist)
+            with idle:
+                in_flight += 1
+            future.add_done_callback(partial(on_done, artist=artist, worker_id=worker_id))
 
-            # Log summary if needed
-            if tracker.should_log_summary():
-                quota_msg = self.context.get_quota_status_message()
-                tracker.log_summary(quota_msg)
+        # Wait for the last callbacks, not just the last futures
+        with idle:
+            idle.wait_for(lambda: in_flight == 0)
+
+    def _submit_task(
+        self,
+        executor: ThreadPoolExecutor,
+        index: int,
+        artist: ArtistData
+    ) -> Tuple[Future, str]:
+        """
+        Submit a single processing task to the executor.
+
+        Args:
+            executor: Thread pool executor
+            index: Position of the artist in the input
+            artist: Artist to process
+
+        Returns:
+            Tuple of (future, worker_id)
+        """
+        # Check for pause before submitting new task
+        self.resource_coordinator.wait_if_paused()
+
+        # Pace submissions under the configured RPM/TPM
+        rate_limiter = self.context.rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire(DEFAULT_ESTIMATED_TOKENS_PER_REQUEST)
+
+        worker_id = self._worker_ids[index % self.max_workers]
+
+        # Hold back submission while the DB pool is contended
+        throttle = self.context.throttle
+        if throttle is not None:
+            throttle.acquire()
+
+        # Submit task
+        future = executor.submit(
+            call_openai_api,
+            self.context.client,
+            artist,
+            self.prompt_id,
+            self.version,
+            worker_id,
+            self.context.db_pool,
+            False,  # skip_existing
+            self.test_mode,
+            self.context.quota_monitor,
+            self.context.pause_controller,
+            None,  # output_path
+            throttle,
+            self.context.bio_batcher,
+        )
+        if throttle is not None:
+            future.add_done_callback(_ThrottleRelease(throttle))
+
+        return future, worker_id
+
+    def _process_result(
+        self,
+        future: Future,
+        artist: ArtistData,
+        worker_id: str,
+        tracker: ProgressTracker
+    ) -> None:
+        """
+        Handle a completed task.
+
+        Args:
+            future: Completed future
+            artist: Artist the task processed
+            worker_id: Worker ID assigned to the task
+            tracker: Progress tracker
+        """
+        try:
+            api_response, duration = future.result()
+            self._store_in_cache(artist, api_response)
+            self._handle_response(api_response, artist, worker_id, duration, tracker)
+
+        except Exception as e:
+            self._handle_exception(e, artist, worker_id, tracker)
+
+        # Log summary if needed
+        if tracker.should_log_summary():
+            quota_msg = self.context.get_quota_status_message()
+            tracker.log_summary(quota_msg)
 
     def _handle_response(
         self,
@@ -177,15 +448,12 @@ class ProcessingOrchestrator:
 
         # Stream response to file
         try:
-            append_jsonl_response(
-                api_response,
-                self.context.output_path,
-                self.prompt_id,
-                self.version
-            )
+            self._stream_response(api_response)
             logger.debug(
-                f"Streamed {'error ' if api_response.error else ''}response "
-                f"for '{artist.name}' to {self.context.output_path}"
+                "Streamed %sresponse for '%s' to %s",
+                "error " if api_response.error else "",
+                artist.name,
+                self.context.output_path,
             )
         except Exception as e:
             logger.error(f"Failed to stream response for '{artist.name}': {e}")
@@ -193,12 +461,36 @@ class ProcessingOrchestrator:
         # Update progress
         tracker.update(success, artist.name, duration, worker_id)
 
-        # Print successful responses to stdout
         if success:
-            print(api_response.response_text)
-
-            # Check for quota-based pause
-            self._check_and_handle_quota_pause()
+            # Echo bios in batches (same bytes as print) unless disabled
+            if self.print_responses:
+                self._stdout_lines.append(api_response.response_text)
+                if len(self._stdout_lines) >= _STDOUT_BATCH_SIZE:
+                    self._flush_stdout()
+
+            # Pause decisions are coarse; check every quota_check_interval successes
+            self._successes_since_quota_check += 1
+            if self._successes_since_quota_check >= self.quota_check_interval:
+                self._successes_since_quota_check = 0
+                self._check_and_handle_quota_pause()
+
+    def _flush_stdout(self) -> None:
+        """Write any buffered bios to stdout in a single call."""
+        if self._stdout_lines:
+            lines, self._stdout_lines = self._stdout_lines, []
+            sys.stdout.write("\n".join(lines) + "\n")
+
+    def _stream_response(self, api_response: ApiResponse) -> None:
+        """Queue a response on the JSONL writer, or append directly without one."""
+        if self._writer is not None:
+            self._writer.write_response(api_response, self.prompt_id, self.version)
+        else:
+            append_jsonl_response(
+                api_response,
+                self.context.output_path,
+                self.prompt_id,
+                self.version
+            )
 
     def _handle_exception(
         self,
@@ -209,7 +501,7 @@ class ProcessingOrchestrator:
     ) -> None:
         """Handle an exception during processing."""
         exc_name = type(exception).__name__
-        error_msg = f"Concurrent processing error [{exc_name}]: {str(exception)}"
+        error_msg = f"Concurrent processing error [{exc_name}]: {exception}"
 
         # Create error response
         error_response = ApiResponse(
@@ -224,15 +516,11 @@ class ProcessingOrchestrator:
 
         # Stream error to file
         try:
-            append_jsonl_response(
-                error_response,
-                self.context.output_path,
-                self.prompt_id,
-                self.version
-            )
+            self._stream_response(error_response)
             logger.debug(
-                f"Streamed exception error response for '{artist.name}' "
-                f"to {self.context.output_path}"
+                "Streamed exception error response for '%s' to %s",
+                artist.name,
+                self.context.output_path,
             )
         except Exception as e:
             logger.error(
@@ -242,7 +530,9 @@ class ProcessingOrchestrator:
         # Update progress
         tracker.update(False, artist.name, 0.0, worker_id)
 
-        logger.error(f"[{worker_id}] Thread error processing artist '{artist.name}': {error_msg}")
+        logger.error(
+            "[%s] Thread error processing artist '%s': %s", worker_id, artist.name, error_msg
+        )
 
     def _check_and_handle_quota_pause(self) -> None:
         """Check quota status and pause if necessary."""
@@ -251,6 +541,9 @@ class ProcessingOrchestrator:
         if should_pause:
             resume_at = self._estimate_resume_time()
 
+            # Don't hold echoed bios back for the length of the pause
+            self._flush_stdout()
+
             # Attempt to pause (idempotent operation)
             if self.resource_coordinator.pause_processing(pause_reason, resume_at):
                 # Schedule auto-resume if pause was newly initiated
@@ -8,16 +8,28 @@ for the artist bio generator application.
 import json
 import logging
 import os
+import queue
 import threading
 from typing import List, Optional, Set
 
 from ..models import ApiResponse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Global lock for JSONL file writing to ensure thread safety
 _jsonl_write_lock = threading.Lock()
 
+# JsonlWriter tuning: buffer size, max lines per write() call and max
+# queued records before producers block
+_WRITER_BUFFER_SIZE = 65536
+_WRITER_BATCH_SIZE = 128
+_WRITER_QUEUE_SIZE = 10000
+
 
 def write_jsonl_output(
     responses: List[ApiResponse],
@@ -35,13 +47,12 @@ def write_jsonl_output(
         version: Optional prompt version used for requests
     """
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            for response in responses:
-                # Create the JSONL record using shared helper
-                record = _create_jsonl_record(response, prompt_id, version)
-                
-                # Write the JSONL record (one JSON object per line)
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        with open(output_path, "wb", buffering=_WRITER_BUFFER_SIZE) as f:
+            # Same encoder as the streaming path (orjson when installed)
+            f.writelines(
+                serialize_jsonl_response(response, prompt_id, version)
+                for response in responses
+            )
 
         logger.info(f"Successfully wrote {len(responses)} records to {output_path}")
 
@@ -99,6 +110,174 @@ def _create_jsonl_record(
     return record
 
 
+def _dumps_jsonl_line(record: dict) -> bytes:
+    """
+    Encode a record as one compact UTF-8 JSONL line.
+
+    Uses orjson when installed, otherwise the stdlib encoder with compact
+    separators. Both emit non-ASCII characters unescaped.
+    """
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def serialize_jsonl_response(
+    response: ApiResponse,
+    prompt_id: str,
+    version: Optional[str] = None,
+) -> bytes:
+    """
+    Serialize an API response to a newline-terminated JSONL line.
+
+    Args:
+        response: The API response to format
+        prompt_id: OpenAI prompt ID used for requests
+        version: Optional prompt version used for requests
+
+    Returns:
+        UTF-8 encoded JSON record followed by a newline
+    """
+    return _dumps_jsonl_line(_create_jsonl_record(response, prompt_id, version))
+
+
+class JsonlWriter:
+    """
+    Buffered JSONL appender running on a dedicated writer thread.
+
+    Callers enqueue lines or responses and return immediately; the writer
+    thread serializes responses, drains the queue in batches into a single
+    persistent, 64KB buffered file handle and flushes whenever the queue
+    goes idle.
+    Closing the writer drains everything still queued, then flushes and
+    fsyncs the file. The queue is bounded, so producers block instead of
+    buffering without limit if the disk falls behind.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(self, output_path: str):
+        """
+        Open the output file and start the writer thread.
+
+        Args:
+            output_path: Path to the output JSONL file (appended to)
+        """
+        self.output_path = output_path
+        self.lines_written = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=_WRITER_QUEUE_SIZE)
+        self._closed = False
+
+        output_dir = os.path.dirname(output_path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+
+        self._file = open(output_path, "ab", buffering=_WRITER_BUFFER_SIZE)
+        self._thread = threading.Thread(
+            target=self._run, name="jsonl-writer", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, line: bytes) -> None:
+        """
+        Queue a serialized, newline-terminated line for writing.
+
+        Args:
+            line: UTF-8 encoded JSONL line to append
+
+        Raises:
+            ValueError: If the writer has been closed
+        """
+        if self._closed:
+            raise ValueError(f"JsonlWriter for {self.output_path} is closed")
+        self._queue.put(line)
+
+    def write_response(
+        self,
+        response: ApiResponse,
+        prompt_id: str,
+        version: Optional[str] = None,
+    ) -> None:
+        """
+        Queue a single API response; it is serialized on the writer thread.
+
+        Args:
+            response: The API response to append
+            prompt_id: OpenAI prompt ID used for requests
+            version: Optional prompt version used for requests
+
+        Raises:
+            ValueError: If the writer has been closed
+        """
+        if self._closed:
+            raise ValueError(f"JsonlWriter for {self.output_path} is closed")
+        self._queue.put((response, prompt_id, version))
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue in batches until the sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            batch = []
+            done = False
+
+            while True:
+                if item is self._SENTINEL:
+                    done = True
+                    break
+                if isinstance(item, tuple):
+                    try:
+                        item = serialize_jsonl_response(*item)
+                    except Exception as e:
+                        logger.error(f"Failed to serialize JSONL record for {item[0].artist_id}: {e}")
+                        item = None
+                if item is not None:
+                    batch.append(item)
+                if len(batch) >= _WRITER_BATCH_SIZE:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    self._file.writelines(batch)
+                    self.lines_written += len(batch)
+                    # Flush once the queue is idle so readers see progress
+                    if self._queue.empty():
+                        self._file.flush()
+                except Exception as e:
+                    logger.error(f"Failed to write {len(batch)} JSONL record(s) to {self.output_path}: {e}")
+
+            if done:
+                return
+
+    def close(self) -> None:
+        """Drain pending lines, then flush, fsync and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+
+        self._queue.put(self._SENTINEL)
+        self._thread.join()
+
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+
+        logger.debug(f"Closed JSONL writer for {self.output_path} ({self.lines_written} records)")
+
+    def __enter__(self) -> "JsonlWriter":
+        """Enter context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the writer on exit."""
+        self.close()
+
+
 def append_jsonl_response(
     response: ApiResponse,
     output_path: str,
@@ -110,7 +289,9 @@ def append_jsonl_response(
     Append a single API response to a JSONL output file.
     
     This function is thread-safe and can be called concurrently to append
-    responses to the same file as they complete processing.
+    responses to the same file as they complete processing. It opens the
+    file per call, so bulk writers should use JsonlWriter, which keeps one
+    buffered handle open and fsyncs once on close.
     
     Args:
         response: The API response to append
@@ -124,24 +305,29 @@ def append_jsonl_response(
         OSError: If filesystem operations fail
     """
     try:
-        # Create the JSONL record
-        record = _create_jsonl_record(response, prompt_id, version)
+        line = serialize_jsonl_response(response, prompt_id, version)
         
-        # Use thread lock to ensure safe concurrent writes
-        with _jsonl_write_lock:
-            # Create directory if it doesn't exist
-            output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
-                if create_if_missing:
-                    os.makedirs(output_dir, exist_ok=True)
-                else:
-                    raise FileNotFoundError(f"Output directory does not exist: {output_dir}")
-            
-            # Append the record to the file
-            file_mode = "a" if os.path.exists(output_path) or create_if_missing else "x"
-            with open(output_path, file_mode, encoding="utf-8") as f:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
-                f.flush()  # Ensure data is written to disk immediately
+        # Create directory if it doesn't exist
+        output_dir = os.path.dirname(output_path)
+        if output_dir and not os.path.exists(output_dir):
+            if create_if_missing:
+                os.makedirs(output_dir, exist_ok=True)
+            else:
+                raise FileNotFoundError(f"Output directory does not exist: {output_dir}")
+        
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        if not create_if_missing and not os.path.exists(output_path):
+            flags |= os.O_EXCL
+        
+        # write() may return short and need several calls per line, and no
+        # atomicity guarantee covers regular files, so every line is written
+        # under the lock to keep concurrent appends from interleaving
+        fd = os.open(output_path, flags, 0o644)
+        try:
+            with _jsonl_write_lock:
+                _write_all(fd, line)
+        finally:
+            os.close(fd)
                 
         logger.debug(f"Appended response for '{response.artist_name}' to {output_path}")
         
@@ -150,6 +336,14 @@ def append_jsonl_response(
         raise
 
 
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of ``data`` to a raw file descriptor, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
 def initialize_jsonl_output(
     output_path: str,
     overwrite_existing: bool = False,
@@ -214,14 +408,16 @@ def get_processed_artist_ids(output_path: str) -> Set[str]:
         return processed_ids
     
     try:
-        with open(output_path, "r", encoding="utf-8") as f:
+        # orjson parses the raw bytes directly; both decoders accept bytes
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(output_path, "rb") as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if not line:
                     continue
                     
                 try:
-                    record = json.loads(line)
+                    record = loads(line)
                     
                     # Extract artist_id from the record
                     if "artist_id" in record:
@@ -234,7 +430,8 @@ def get_processed_artist_ids(output_path: str) -> Set[str]:
                     else:
                         logger.warning(f"Line {line_num}: Missing artist_id field in JSONL record")
                         
-                except json.JSONDecodeError as e:
+                except ValueError as e:
+                    # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
                     logger.warning(f"Line {line_num}: Invalid JSON in JSONL file: {e}")
                     continue
                     
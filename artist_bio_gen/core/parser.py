@@ -14,6 +14,9 @@ from ..database import validate_uuid
 
 logger = logging.getLogger(__name__)
 
+# First-column values that mark an optional header row
+_HEADER_FIELDS = frozenset({"artist_id", "id", "uuid"})
+
 
 def parse_input_file(file_path: str, skip_processed_ids: Optional[Set[str]] = None) -> ParseResult:
     """
@@ -53,15 +56,18 @@ def parse_input_file(file_path: str, skip_processed_ids: Optional[Set[str]] = No
                     skipped_lines += 1
                     continue
 
+                # Strip the first field once; it drives the comment, header
+                # and UUID checks below
+                artist_id = row[0].strip()
+
                 # Skip comment lines (lines starting with #)
-                if row[0].strip().startswith("#"):
+                if artist_id.startswith("#"):
                     skipped_lines += 1
                     continue
 
                 # Skip header row if it looks like a header
                 if not header_skipped and len(row) >= 2:
-                    first_field = row[0].strip().lower()
-                    if first_field in ["artist_id", "id", "uuid"]:
+                    if artist_id.lower() in _HEADER_FIELDS:
                         header_skipped = True
                         skipped_lines += 1
                         continue
@@ -75,7 +81,6 @@ def parse_input_file(file_path: str, skip_processed_ids: Optional[Set[str]] = No
                         error_lines += 1
                         continue
 
-                    artist_id = row[0].strip()
                     artist_name = row[1].strip()
                     artist_data = row[2].strip() if len(row) > 2 else None
 
@@ -95,7 +100,12 @@ def parse_input_file(file_path: str, skip_processed_ids: Optional[Set[str]] = No
 
                     # Skip already-processed artists if resume mode is enabled
                     if skip_processed_ids and artist_id in skip_processed_ids:
-                        logger.debug(f"Line {line_num}: Skipping already-processed artist: {artist_name} ({artist_id})")
+                        logger.debug(
+                            "Line %d: Skipping already-processed artist: %s (%s)",
+                            line_num,
+                            artist_name,
+                            artist_id,
+                        )
                         resumed_skipped += 1
                         continue
 
@@ -17,7 +17,6 @@ from ..database.connection import get_db_connection, release_db_connection
 from ..database.operations import update_artist_bio
 from ..models.api import ApiResponse
 from ..models.artist import ArtistData
-from ..models.quota import ErrorClassification
 from ..utils.logging import log_transaction_failure, log_transaction_success
 from ..utils.text import strip_trailing_citations
 
@@ -37,6 +36,8 @@ class RequestContext:
     db_pool: Optional[Any] = None
     quota_monitor: Optional[Any] = None
     pause_controller: Optional[Any] = None
+    throttle: Optional[Any] = None
+    bio_batcher: Optional[Any] = None
 
 
 @dataclass
@@ -55,6 +56,9 @@ class ProcessingResult:
     start_time: float = field(default_factory=time.time)
     end_time: Optional[float] = None
     duration: Optional[float] = None
+    _api_response: Optional[ApiResponse] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def calculate_duration(self) -> float:
         """Calculate and set the duration."""
@@ -64,17 +68,28 @@ class ProcessingResult:
         return self.duration
 
     def to_api_response(self) -> ApiResponse:
-        """Convert to ApiResponse for backward compatibility."""
-        return ApiResponse(
-            artist_id=self.artist.artist_id,
-            artist_name=self.artist.name,
-            artist_data=self.artist.data,
-            response_text=self.response_text,
-            response_id=self.response_id,
-            created=self.created,
-            db_status=self.db_status,
-            error=self.error,
-        )
+        """
+        Convert to ApiResponse for backward compatibility.
+
+        The response is built once and reused; call invalidate_api_response()
+        after changing any field it carries.
+        """
+        if self._api_response is None:
+            self._api_response = ApiResponse(
+                artist_id=self.artist.artist_id,
+                artist_name=self.artist.name,
+                artist_data=self.artist.data,
+                response_text=self.response_text,
+                response_id=self.response_id,
+                created=self.created,
+                db_status=self.db_status,
+                error=self.error,
+            )
+        return self._api_response
+
+    def invalidate_api_response(self) -> None:
+        """Drop the cached ApiResponse so the next call rebuilds it."""
+        self._api_response = None
 
 
 class ProcessingStep(ABC):
@@ -107,16 +122,18 @@ class HeaderExtractionStep(ProcessingStep):
 
     def process(self, result: ProcessingResult, context: RequestContext) -> ProcessingResult:
         """Extract headers and usage stats from raw response."""
-        if result.raw_response is None:
+        raw = result.raw_response
+        if raw is None:
             return result
 
         # Try to extract headers
-        result.headers = getattr(result.raw_response, "headers", {}) or {}
+        result.headers = getattr(raw, "headers", None) or {}
 
-        # Try to parse response if raw response available
-        if hasattr(result.raw_response, "parse"):
+        # Try to parse response if raw response available (single lookup)
+        parse = getattr(raw, "parse", None)
+        if parse is not None:
             try:
-                parsed = result.raw_response.parse()
+                parsed = parse()
                 result.usage_stats = getattr(parsed, "usage", None)
                 # Store parsed response for next steps
                 result.raw_response = parsed
@@ -148,6 +165,7 @@ class ResponseParsingStep(ProcessingStep):
                 f"[{context.worker_id}] ✂️ Stripped trailing citations from API response for {result.artist.name}"
             )
         result.response_text = cleaned_text
+        result.invalidate_api_response()
 
         # Extract usage if not already done
         if result.usage_stats is None:
@@ -164,6 +182,10 @@ class QuotaUpdateStep(ProcessingStep):
         if context.quota_monitor is None:
             return result
 
+        # Nothing to parse (cached/stub responses, error paths)
+        if not result.headers and result.usage_stats is None:
+            return result
+
         try:
             metrics = context.quota_monitor.update_from_response(
                 result.headers,
@@ -180,7 +202,14 @@ class QuotaUpdateStep(ProcessingStep):
 
 
 class DatabaseUpdateStep(ProcessingStep):
-    """Handle database connection and bio updates."""
+    """
+    Handle database connection and bio updates.
+
+    Runs only after the API response has been parsed. A pooled connection
+    is checked out just for the UPDATE and returned in ``finally``, never
+    held across the HTTP round-trip, so a small pool can serve many more
+    workers than it has connections.
+    """
 
     def process(self, result: ProcessingResult, context: RequestContext) -> ProcessingResult:
         """Update database with bio if pool provided."""
@@ -189,24 +218,37 @@ class DatabaseUpdateStep(ProcessingStep):
 
         db_connection = None
         try:
-            # Get database connection
-            db_connection = get_db_connection(context.db_pool)
-            if db_connection is None:
-                result.db_status = "error"
-                logger.warning(
-                    f"[{context.worker_id}] 💥 Failed to get database connection for {result.artist.name}"
+            if context.bio_batcher is not None:
+                # Group commit: blocks until this row's batch is committed
+                db_result = context.bio_batcher.submit(
+                    artist_id=result.artist.artist_id,
+                    bio=result.response_text,
+                    skip_existing=context.skip_existing,
+                    test_mode=context.test_mode,
+                    worker_id=context.worker_id,
+                )
+            else:
+                # Get database connection, reporting pool wait to the throttle
+                wait_start = time.monotonic()
+                db_connection = get_db_connection(context.db_pool)
+                if context.throttle is not None:
+                    context.throttle.record_wait(time.monotonic() - wait_start)
+                if db_connection is None:
+                    result.db_status = "error"
+                    logger.warning(
+                        f"[{context.worker_id}] 💥 Failed to get database connection for {result.artist.name}"
+                    )
+                    return result
+
+                # Update database
+                db_result = update_artist_bio(
+                    connection=db_connection,
+                    artist_id=result.artist.artist_id,
+                    bio=result.response_text,
+                    skip_existing=context.skip_existing,
+                    test_mode=context.test_mode,
+                    worker_id=context.worker_id,
                 )
-                return result
-
-            # Update database
-            db_result = update_artist_bio(
-                connection=db_connection,
-                artist_id=result.artist.artist_id,
-                bio=result.response_text,
-                skip_existing=context.skip_existing,
-                test_mode=context.test_mode,
-                worker_id=context.worker_id,
-            )
 
             if db_result.success:
                 if db_result.rows_affected > 0:
@@ -227,6 +269,7 @@ class DatabaseUpdateStep(ProcessingStep):
                 f"[{context.worker_id}] 💥 Database update error for {result.artist.name}: {str(e)}"
             )
         finally:
+            result.invalidate_api_response()
             # Always release connection back to pool
             if db_connection is not None:
                 release_db_connection(context.db_pool, db_connection)
@@ -301,16 +344,6 @@ class OutputStreamingStep(ProcessingStep):
         return result
 
 
-class ErrorClassificationStep(ProcessingStep):
-    """Classify errors for retry logic."""
-
-    def process(self, result: ProcessingResult, context: RequestContext) -> ProcessingResult:
-        """Classify any error that occurred."""
-        # This step is mainly for documentation/structure
-        # Actual error classification happens in retry decorator
-        return result
-
-
 class ResponseProcessor:
     """Unified pipeline for processing API responses."""
 
@@ -387,6 +420,7 @@ class ResponseProcessor:
             except Exception as e:
                 # Handle step error
                 result.error = f"{step} failed: {str(e)}"
+                result.invalidate_api_response()
                 result.calculate_duration()
 
                 # Log the error
@@ -8,24 +8,22 @@ and statistics calculation for the artist bio generator application.
 import logging
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 
 from ..models import ArtistData, ApiResponse, ProcessingStats
 from ..api import call_openai_api
 from ..api.quota import QuotaMonitor, PauseController
+from ..constants import DEFAULT_DB_BATCH_SIZE
+from ..database.connection import ConnectionPool
 from ..utils import create_progress_bar
 # Database connection handling now done in call_openai_api
-from .output import append_jsonl_response, initialize_jsonl_output
 from .resources import ProcessingContext
 from .orchestrator import ProcessingOrchestrator
 from .progress import BatchProgressReporter
 
-try:
+if TYPE_CHECKING:
     from openai import OpenAI
-except ImportError:
-    OpenAI = None
 
 logger = logging.getLogger(__name__)
 
@@ -141,12 +139,11 @@ def log_processing_start(
         Start timestamp for timing calculations
     """
     start_time = time.time()
-    start_datetime = datetime.fromtimestamp(start_time)
 
     logger.info("=" * 70)
     logger.info("ARTIST BIO GENERATION - PROCESSING STARTED")
     logger.info("=" * 70)
-    logger.info(f"Start time: {start_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"Start time: {format_timestamp(start_time)}")
     logger.info(f"Input file: {input_file}")
     logger.info(f"Prompt ID: {prompt_id}")
     logger.info(f"Total artists to process: {total_artists}")
@@ -175,13 +172,19 @@ def log_progress_update(
         duration: Time taken for this artist
         worker_id: Unique identifier for the worker thread
     """
+    # Skip all formatting work when INFO is filtered out
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     percentage = (current / total) * 100
     status_icon = "✅" if success else "❌"
     status_text = "SUCCESS" if success else "FAILED"
     progress_bar = create_progress_bar(current, total)
 
     logger.info(
-        f"{progress_bar} [{current:3d}/{total:3d}] ({percentage:5.1f}%) [{worker_id}] {status_icon} {artist_name} - {status_text} ({duration:.2f}s)"
+        "%s [%3d/%3d] (%5.1f%%) [%s] %s %s - %s (%.2fs)",
+        progress_bar, current, total, percentage, worker_id,
+        status_icon, artist_name, status_text, duration,
     )
 
 
@@ -192,15 +195,23 @@ def log_processing_summary(stats: ProcessingStats):
     Args:
         stats: Processing statistics to log
     """
-    end_datetime = datetime.fromtimestamp(stats.end_time)
+    end_time_str = stats.end_time_str or format_timestamp(stats.end_time)
+    total_duration_str = stats.total_duration_str or format_duration(stats.total_duration)
+    if stats.success_rate is None:
+        # Built by hand rather than by calculate_processing_stats
+        stats = stats._replace(**_derived_metrics(
+            stats.total_artists,
+            stats.successful_calls,
+            stats.failed_calls,
+            stats.total_duration,
+            stats.avg_time_per_artist,
+        ))
 
     logger.info("=" * 70)
     logger.info("PROCESSING SUMMARY")
     logger.info("=" * 70)
-    logger.info(f"End time: {end_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info(
-        f"Total duration: {stats.total_duration:.2f} seconds ({timedelta(seconds=int(stats.total_duration))})"
-    )
+    logger.info(f"End time: {end_time_str}")
+    logger.info(f"Total duration: {stats.total_duration:.2f} seconds ({total_duration_str})")
     logger.info("")
     logger.info("INPUT STATISTICS:")
     logger.info(f"  Total artists processed: {stats.total_artists}")
@@ -210,30 +221,23 @@ def log_processing_summary(stats: ProcessingStats):
     logger.info("API CALL STATISTICS:")
     logger.info(f"  Successful calls: {stats.successful_calls}")
     logger.info(f"  Failed calls: {stats.failed_calls}")
-    logger.info(
-        f"  Success rate: {(stats.successful_calls / stats.total_artists * 100):.1f}%"
-    )
+    logger.info(f"  Success rate: {stats.success_rate:.1f}%")
     logger.info("")
     logger.info("PERFORMANCE STATISTICS:")
     logger.info(f"  Average time per artist: {stats.avg_time_per_artist:.2f}s")
     logger.info(f"  API calls per second: {stats.api_calls_per_second:.2f}")
 
-    if stats.successful_calls > 0:
-        estimated_total_time = stats.avg_time_per_artist * stats.total_artists
-        logger.info(f"  Estimated total time: {estimated_total_time:.2f}s")
+    if stats.estimated_total_time is not None:
+        logger.info(f"  Estimated total time: {stats.estimated_total_time:.2f}s")
 
-    # Calculate efficiency metrics
-    if stats.total_artists > 0:
-        processing_efficiency = (stats.successful_calls / stats.total_artists) * 100
-        logger.info(f"  Processing efficiency: {processing_efficiency:.1f}%")
+    if stats.processing_efficiency is not None:
+        logger.info(f"  Processing efficiency: {stats.processing_efficiency:.1f}%")
 
     # Time breakdown
-    if stats.total_duration > 0:
-        successful_time = stats.avg_time_per_artist * stats.successful_calls
-        failed_time = stats.total_duration - successful_time
-        logger.info(f"  Time spent on successful calls: {successful_time:.2f}s")
-        if failed_time > 0:
-            logger.info(f"  Time spent on failed calls: {failed_time:.2f}s")
+    if stats.successful_time is not None:
+        logger.info(f"  Time spent on successful calls: {stats.successful_time:.2f}s")
+        if stats.failed_time:
+            logger.info(f"  Time spent on failed calls: {stats.failed_time:.2f}s")
 
     logger.info("=" * 70)
 
@@ -275,6 +279,9 @@ def calculate_processing_stats(
     total_duration = end_time - start_time
     avg_time_per_artist = total_duration / total_artists if total_artists > 0 else 0
     api_calls_per_second = total_artists / total_duration if total_duration > 0 else 0
+    derived = _derived_metrics(
+        total_artists, successful_calls, failed_calls, total_duration, avg_time_per_artist
+    )
 
     return ProcessingStats(
         total_artists=total_artists,
@@ -287,22 +294,99 @@ def calculate_processing_stats(
         total_duration=total_duration,
         avg_time_per_artist=avg_time_per_artist,
         api_calls_per_second=api_calls_per_second,
+        end_time_str=format_timestamp(end_time),
+        total_duration_str=format_duration(total_duration),
+        **derived,
     )
 
 
+def _derived_metrics(
+    total_artists: int,
+    successful_calls: int,
+    failed_calls: int,
+    total_duration: float,
+    avg_time_per_artist: float,
+) -> dict:
+    """
+    Compute the summary-only metrics of ProcessingStats in one place.
+
+    Args:
+        total_artists: Total number of artists
+        successful_calls: Number of successful API calls
+        failed_calls: Number of failed API calls
+        total_duration: Total processing duration in seconds
+        avg_time_per_artist: Average processing time per artist
+
+    Returns:
+        Keyword arguments for the derived ProcessingStats fields
+    """
+    has_artists = total_artists > 0
+    success_rate = successful_calls / total_artists * 100 if has_artists else 0.0
+    has_duration = total_duration > 0
+
+    return {
+        "success_rate": success_rate,
+        "processing_efficiency": success_rate if has_artists else None,
+        "successful_time": avg_time_per_artist * successful_calls if has_duration else None,
+        "failed_time": avg_time_per_artist * failed_calls if has_duration else None,
+        "estimated_total_time": (
+            avg_time_per_artist * total_artists if successful_calls > 0 else None
+        ),
+    }
+
+
+def format_timestamp(timestamp: float) -> str:
+    """
+    Format a Unix timestamp as local "YYYY-MM-DD HH:MM:SS".
+
+    Args:
+        timestamp: Unix timestamp
+
+    Returns:
+        Formatted local time
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format whole seconds exactly like ``str(timedelta(seconds=int(seconds)))``.
+
+    Args:
+        seconds: Duration in seconds (fractions are truncated)
+
+    Returns:
+        "H:MM:SS", prefixed with "N day(s), " for durations of a day or more
+    """
+    days, remainder = divmod(int(seconds), 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, secs = divmod(remainder, 60)
+    hms = f"{hours}:{minutes:02d}:{secs:02d}"
+    if days:
+        return f"{days} day{'' if abs(days) == 1 else 's'}, {hms}"
+    return hms
+
+
 def process_artists_concurrent(
-    artists: List[ArtistData],
+    artists: Iterable[ArtistData],
     client: "OpenAI",
     prompt_id: str,
     version: Optional[str],
     max_workers: int,
     output_path: str,
-    db_pool: Optional[object] = None,
+    db_pool: Optional["ConnectionPool"] = None,
     test_mode: bool = False,
     resume_mode: bool = False,
     daily_request_limit: Optional[int] = None,
     quota_threshold: float = 0.8,
     quota_monitoring: bool = True,
+    cache_path: Optional[str] = None,
+    cache_policy: str = "enabled",
+    rate_limit_rpm: Optional[int] = None,
+    rate_limit_tpm: Optional[int] = None,
+    db_batch_size: int = DEFAULT_DB_BATCH_SIZE,
+    print_responses: bool = True,
+    total_artists: Optional[int] = None,
 ) -> Tuple[int, int]:
     """
     Process artists concurrently with streaming JSONL output.
@@ -312,7 +396,8 @@ def process_artists_concurrent(
     and fault-tolerant operation.
 
     Args:
-        artists: List of artists to process
+        artists: Artists to process; any iterable (e.g. a generator) is
+            consumed lazily as worker slots free up
         client: Initialized OpenAI client
         prompt_id: OpenAI prompt ID
         version: Optional prompt version
@@ -324,6 +409,15 @@ def process_artists_concurrent(
         daily_request_limit: Optional daily request limit for quota monitoring
         quota_threshold: Pause threshold as decimal (0.8 = 80%)
         quota_monitoring: If True, enable quota monitoring and pause/resume
+        cache_path: Optional SQLite response cache path; cached artists skip the API
+        cache_policy: Response cache policy: enabled, read-only, replay or disabled
+        rate_limit_rpm: Optional requests-per-minute cap enforced before each submission
+        rate_limit_tpm: Optional tokens-per-minute cap enforced before each submission
+        db_batch_size: Bio updates committed per database transaction; 1 disables
+            batching and throttles concurrency on DB pool waits instead
+        print_responses: If True, echo each successful bio to stdout
+        total_artists: Artist count for progress reporting when ``artists``
+            has no len() (defaults to len(artists))
 
     Returns:
         Tuple of (successful_calls, failed_calls)
@@ -337,6 +431,12 @@ def process_artists_concurrent(
         daily_request_limit=daily_request_limit,
         quota_threshold=quota_threshold,
         quota_monitoring=quota_monitoring,
+        max_workers=max_workers,
+        cache_path=cache_path,
+        cache_policy=cache_policy,
+        rate_limit_rpm=rate_limit_rpm,
+        rate_limit_tpm=rate_limit_tpm,
+        db_batch_size=db_batch_size,
     )
 
     # Use context manager for proper resource lifecycle
@@ -348,7 +448,8 @@ def process_artists_concurrent(
             version=version,
             max_workers=max_workers,
             test_mode=test_mode,
+            print_responses=print_responses,
         )
 
         # Process artists and return results
-        return orchestrator.process_artists(artists)
+        return orchestrator.process_artists(artists, total_artists)
@@ -6,6 +6,7 @@ during concurrent artist processing operations.
 """
 
 import logging
+import threading
 import time
 from datetime import datetime
 from typing import Optional, Tuple
@@ -18,20 +19,31 @@ class ProgressTracker:
     Tracks and reports processing progress.
 
     Handles progress calculations, ETA estimation, and logging
-    of progress updates during concurrent processing.
+    of progress updates during concurrent processing. Counters and
+    log-interval state are guarded by a lock, so every method may be
+    called from any worker thread.
     """
 
-    def __init__(self, total_items: int, log_interval_percent: int = 10):
+    def __init__(
+        self,
+        total_items: int,
+        log_interval_percent: int = 10,
+        log_every_item: bool = True,
+    ):
         """
         Initialize progress tracker.
 
         Args:
             total_items: Total number of items to process
             log_interval_percent: Log progress every N percent (default 10%)
+            log_every_item: If False, per-item lines are logged only for
+                failures and whenever a progress summary is due
         """
         self.total_items = total_items
+        self.log_every_item = log_every_item
         self.successful_items = 0
         self.failed_items = 0
+        self._lock = threading.Lock()
         self.start_time = time.time()
         self.last_log_time = self.start_time
         self.last_logged_count = 0
@@ -56,20 +68,21 @@ class ProgressTracker:
             duration: Processing duration in seconds
             worker_id: ID of the worker that processed the item
         """
-        if success:
-            self.successful_items += 1
-        else:
-            self.failed_items += 1
-
-        total_processed = self.successful_items + self.failed_items
+        # Completions may arrive from several worker threads at once
+        with self._lock:
+            if success:
+                self.successful_items += 1
+            else:
+                self.failed_items += 1
+            total_processed = self.successful_items + self.failed_items
+
+        # Failures are always logged; successes are sampled unless asked for
+        if success and not (self.log_every_item or self.should_log_summary()):
+            return
 
         # Log individual progress
         self._log_item_progress(
-            total_processed,
-            artist_name,
-            success,
-            duration,
-            worker_id
+            total_processed, artist_name, success, duration, worker_id
         )
 
     def should_log_summary(self) -> bool:
@@ -79,22 +92,20 @@ class ProgressTracker:
         Returns:
             True if summary should be logged based on interval or time
         """
-        total_processed = self.successful_items + self.failed_items
         current_time = time.time()
+        with self._lock:
+            total_processed = self.successful_items + self.failed_items
 
-        # Check if we've completed processing
-        if total_processed == self.total_items:
-            return True
-
-        # Check interval-based logging
-        if total_processed - self.last_logged_count >= self.log_interval:
-            return True
+            # Check if we've completed processing
+            if total_processed == self.total_items:
+                return True
 
-        # Check time-based logging
-        if current_time - self.last_log_time >= self.min_time_between_logs:
-            return True
+            # Check interval-based logging
+            if total_processed - self.last_logged_count >= self.log_interval:
+                return True
 
-        return False
+            # Check time-based logging
+            return current_time - self.last_log_time >= self.min_time_between_logs
 
     def log_summary(self, quota_status_message: str = "") -> None:
         """
@@ -103,8 +114,12 @@ class ProgressTracker:
         Args:
             quota_status_message: Optional quota status to include
         """
-        total_processed = self.successful_items + self.failed_items
         current_time = time.time()
+        with self._lock:
+            total_processed = self.successful_items + self.failed_items
+            # Update tracking
+            self.last_log_time = current_time
+            self.last_logged_count = total_processed
 
         elapsed_time = current_time - self.start_time
         current_rate = total_processed / elapsed_time if elapsed_time > 0 else 0
@@ -126,10 +141,6 @@ class ProgressTracker:
 
         logger.info(message)
 
-        # Update tracking
-        self.last_log_time = current_time
-        self.last_logged_count = total_processed
-
     def get_stats(self) -> Tuple[int, int]:
         """
         Get current processing statistics.
@@ -137,7 +148,8 @@ class ProgressTracker:
         Returns:
             Tuple of (successful_calls, failed_calls)
         """
-        return self.successful_items, self.failed_items
+        with self._lock:
+            return self.successful_items, self.failed_items
 
     def _log_item_progress(
         self,
@@ -148,8 +160,10 @@ class ProgressTracker:
         worker_id: str
     ) -> None:
         """Log progress for an individual item."""
-        status_emoji = "✓" if success else "✗"
-        status_text = "Success" if success else "Failed"
+        level = logging.INFO if success else logging.WARNING
+        # Skip all formatting work when the level is filtered out
+        if not logger.isEnabledFor(level):
+            return
 
         # Calculate progress percentage
         progress_percent = (total_processed / self.total_items * 100) if self.total_items > 0 else 0
@@ -157,15 +171,15 @@ class ProgressTracker:
         # Log at appropriate level
         if success:
             logger.info(
-                f"[{worker_id}] {status_emoji} {artist_name} - "
-                f"{status_text} ({duration:.2f}s) - "
-                f"Progress: {total_processed}/{self.total_items} ({progress_percent:.1f}%)"
+                "[%s] ✓ %s - Success (%.2fs) - Progress: %d/%d (%.1f%%)",
+                worker_id, artist_name, duration,
+                total_processed, self.total_items, progress_percent,
             )
         else:
             logger.warning(
-                f"[{worker_id}] {status_emoji} {artist_name} - "
-                f"{status_text} - "
-                f"Progress: {total_processed}/{self.total_items} ({progress_percent:.1f}%)"
+                "[%s] ✗ %s - Failed - Progress: %d/%d (%.1f%%)",
+                worker_id, artist_name,
+                total_processed, self.total_items, progress_percent,
             )
 
 
@@ -7,19 +7,22 @@ API clients, quota monitors, and output managers.
 """
 
 import logging
+import math
 import threading
-from typing import Optional, Dict, Any, List
+from collections import deque
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 from contextlib import contextmanager
 
-from ..api.quota import QuotaMonitor, PauseController
+from ..api.quota import QuotaMonitor, PauseController, TokenBucket
+from ..constants import DEFAULT_DB_BATCH_SIZE
+from ..database.batch import BioUpdateBatcher
+from ..database.connection import ConnectionPool
 from ..models import ProcessingStats
-from .output import initialize_jsonl_output
+from .cache import ResponseCache
+from .output import JsonlWriter, initialize_jsonl_output
 
-try:
+if TYPE_CHECKING:
     from openai import OpenAI
-except ImportError:
-    OpenAI = None
-
 logger = logging.getLogger(__name__)
 
 
@@ -29,9 +32,10 @@ class ProcessingContext:
 
     This context manager ensures proper initialization and cleanup of:
     - OpenAI API client
-    - Database connection pool
+    - Database connection pool and group-commit bio batcher
     - Quota monitoring and pause control
     - Output file management
+    - Response cache
     - Progress tracking
     """
 
@@ -39,11 +43,17 @@ class ProcessingContext:
         self,
         client: "OpenAI",
         output_path: str,
-        db_pool: Optional[object] = None,
+        db_pool: Optional["ConnectionPool"] = None,
         resume_mode: bool = False,
         daily_request_limit: Optional[int] = None,
         quota_threshold: float = 0.8,
         quota_monitoring: bool = True,
+        max_workers: Optional[int] = None,
+        cache_path: Optional[str] = None,
+        cache_policy: str = "enabled",
+        rate_limit_rpm: Optional[int] = None,
+        rate_limit_tpm: Optional[int] = None,
+        db_batch_size: int = DEFAULT_DB_BATCH_SIZE,
     ):
         """
         Initialize processing context with required resources.
@@ -56,6 +66,15 @@ class ProcessingContext:
             daily_request_limit: Optional daily request limit
             quota_threshold: Pause threshold as decimal (0.8 = 80%)
             quota_monitoring: If True, enable quota monitoring
+            max_workers: Optional worker count; with a database pool this
+                enables adaptive concurrency throttling
+            cache_path: Optional path to the SQLite response cache
+            cache_policy: Response cache policy (see core.cache.CACHE_POLICIES)
+            rate_limit_rpm: Optional client-side requests-per-minute cap
+            rate_limit_tpm: Optional client-side tokens-per-minute cap
+            db_batch_size: Rows per group-commit transaction; 1 writes each
+                bio in its own transaction and enables the concurrency
+                throttle instead (batching replaces the throttle)
         """
         self.client = client
         self.output_path = output_path
@@ -64,23 +83,49 @@ class ProcessingContext:
         self.daily_request_limit = daily_request_limit
         self.quota_threshold = quota_threshold
         self.quota_monitoring_enabled = quota_monitoring
+        self.cache_path = cache_path
+        self.cache_policy = cache_policy
+        self.db_batch_size = db_batch_size
 
         # Resources to be initialized
         self.quota_monitor: Optional[QuotaMonitor] = None
         self.pause_controller: Optional[PauseController] = None
         self.output_initialized: bool = False
-        self._lock = threading.Lock()
+        self.response_cache: Optional[ResponseCache] = None
+        self.bio_batcher: Optional[BioUpdateBatcher] = None
+        self.jsonl_writer: Optional[JsonlWriter] = None
+
+        # Pace submissions ahead of the server's rate limits
+        self.rate_limiter: Optional[TokenBucket] = None
+        if rate_limit_rpm or rate_limit_tpm:
+            self.rate_limiter = TokenBucket(rpm=rate_limit_rpm, tpm=rate_limit_tpm)
+
+        # Shed concurrency when the database pool becomes the bottleneck.
+        # Only per-row writes contend for the pool; group commit replaces
+        # the throttle because it holds one connection per batch.
+        self.throttle: Optional[ConcurrencyThrottle] = None
+        if db_pool is not None and max_workers and db_batch_size <= 1:
+            self.throttle = ConcurrencyThrottle(max_workers)
 
     def __enter__(self) -> "ProcessingContext":
         """Initialize all processing resources."""
         try:
-            # Initialize output file
+            # Initialize output file and the writer thread that appends to it
             self._initialize_output()
+            self.jsonl_writer = JsonlWriter(self.output_path)
 
             # Initialize quota monitoring if enabled
             if self.quota_monitoring_enabled:
                 self._initialize_quota_monitoring()
 
+            # Open response cache if configured
+            if self.cache_path and self.cache_policy != "disabled":
+                self.response_cache = ResponseCache(self.cache_path, self.cache_policy)
+
+            # Start group-commit batcher for database writes
+            if self.db_pool is not None and self.db_batch_size > 1:
+                self.bio_batcher = BioUpdateBatcher(self.db_pool, batch_size=self.db_batch_size)
+
             logger.info("Processing context initialized successfully")
             return self
 
@@ -91,9 +136,20 @@ class ProcessingContext:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Clean up all processing resources."""
-        # No special cleanup needed for current resources
+        if self.bio_batcher is not None:
+            self.bio_batcher.close()
+            self.bio_batcher = None
+
+        if self.response_cache is not None:
+            self.response_cache.close()
+            self.response_cache = None
+
+        # Drain queued records, then flush, fsync and close the output file
+        if self.jsonl_writer is not None:
+            self.jsonl_writer.close()
+            self.jsonl_writer = None
+
         # DB pool is managed externally
-        # Output file is closed after each write
         logger.debug("Processing context cleaned up")
 
     def _initialize_output(self):
@@ -131,6 +187,92 @@ class ProcessingContext:
         return f"Quota: {metrics.usage_percentage:.1f}% used"
 
 
+class ConcurrencyThrottle:
+    """
+    Adaptive limit on in-flight tasks driven by database connection waits.
+
+    Workers report how long they waited for a pooled connection. When the
+    p95 of the recent waits exceeds the threshold, one permit is shed so
+    fewer tasks compete for the pool; once waits fall back below half the
+    threshold, permits are restored up to the original maximum.
+    """
+
+    def __init__(
+        self,
+        max_permits: int,
+        wait_threshold: float = 0.05,
+        window_size: int = 64,
+    ):
+        """
+        Initialize concurrency throttle.
+
+        Args:
+            max_permits: Maximum number of concurrent tasks
+            wait_threshold: p95 connection wait (seconds) that triggers shedding
+            window_size: Number of recent waits considered
+        """
+        self.max_permits = max(1, max_permits)
+        self.wait_threshold = wait_threshold
+        self.window_size = max(1, window_size)
+        self._limit = self.max_permits
+        self._in_use = 0
+        self._waits: deque = deque(maxlen=self.window_size)
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of permits available to tasks."""
+        return self._limit
+
+    def acquire(self) -> None:
+        """Block until a permit is available under the current limit."""
+        with self._cond:
+            while self._in_use >= self._limit:
+                self._cond.wait()
+            self._in_use += 1
+
+    def release(self) -> None:
+        """Return a permit taken by acquire()."""
+        with self._cond:
+            self._in_use = max(0, self._in_use - 1)
+            self._cond.notify()
+
+    def record_wait(self, seconds: float) -> None:
+        """
+        Record a connection wait and adjust the limit if needed.
+
+        Args:
+            seconds: Time spent waiting for a database connection
+        """
+        with self._cond:
+            self._waits.append(seconds)
+            if len(self._waits) < self.window_size:
+                return
+
+            # Nearest-rank p95
+            ordered = sorted(self._waits)
+            p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+            if p95 > self.wait_threshold and self._limit > 1:
+                self._limit -= 1
+                logger.info(
+                    f"DB connection wait p95 {p95 * 1000:.0f}ms, "
+                    f"reducing concurrency to {self._limit}"
+                )
+            elif p95 < self.wait_threshold / 2 and self._limit < self.max_permits:
+                self._limit += 1
+                logger.info(
+                    f"DB connection wait p95 {p95 * 1000:.0f}ms, "
+                    f"restoring concurrency to {self._limit}"
+                )
+                self._cond.notify()
+            else:
+                return
+
+            # Judge the new limit on fresh samples only
+            self._waits.clear()
+
+
 class OutputManager:
     """
     Thread-safe manager for streaming output operations.
@@ -178,12 +320,14 @@ class TimerManager:
 
     def cancel_all(self):
         """Cancel all active timers."""
+        # Detach the list under the lock; cancel() runs outside it
         with self._lock:
-            if self._active_timers:
-                logger.debug(f"Cancelling {len(self._active_timers)} active auto-resume timer(s)")
-                for timer in self._active_timers:
-                    timer.cancel()
-                self._active_timers.clear()
+            timers, self._active_timers = self._active_timers, []
+
+        if timers:
+            logger.debug(f"Cancelling {len(timers)} active auto-resume timer(s)")
+            for timer in timers:
+                timer.cancel()
 
     def __enter__(self):
         """Enter context."""
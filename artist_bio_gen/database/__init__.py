@@ -20,13 +20,21 @@ from .config import (
 
 from .operations import (
     update_artist_bio,
+    update_artist_bios_batch,
     get_table_name,
     retry_with_exponential_backoff,
+    cancel_retry_backoff,
+    reset_retry_backoff,
+)
+
+from .batch import (
+    BioUpdateBatcher,
 )
 
 from .utils import (
     classify_database_error,
     validate_uuid,
+    canonical_uuid,
 )
 
 __all__ = [
@@ -40,9 +48,14 @@ __all__ = [
     "create_database_config",
     # Operations
     "update_artist_bio",
+    "update_artist_bios_batch",
     "get_table_name",
     "retry_with_exponential_backoff",
+    "cancel_retry_backoff",
+    "reset_retry_backoff",
+    "BioUpdateBatcher",
     # Utilities
     "classify_database_error",
     "validate_uuid",
+    "canonical_uuid",
 ]
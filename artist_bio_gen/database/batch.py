@@ -0,0 +1,328 @@
+"""
+Database group-commit module.
+
+This module provides a background batcher that collects bio updates from
+concurrent workers and applies them in multi-row transactions, so the
+database pays one round-trip and one commit per batch instead of per artist.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Set, Tuple
+
+from ..constants import DEFAULT_DB_BATCH_SIZE
+from ..models import DatabaseResult
+from .connection import ConnectionPool, get_db_connection, release_db_connection
+from .operations import update_artist_bio, update_artist_bios_batch, wait_for_retry
+from .utils import canonical_uuid, classify_database_error
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = DEFAULT_DB_BATCH_SIZE
+DEFAULT_LINGER_SECONDS = 0.05
+DEFAULT_MAX_RETRIES = 3
+
+
+class _PendingUpdate:
+    """A single queued bio update awaiting its batch commit."""
+
+    __slots__ = ("artist_id", "bio", "skip_existing", "test_mode", "future")
+
+    def __init__(self, artist_id: str, bio: str, skip_existing: bool, test_mode: bool):
+        self.artist_id = artist_id
+        self.bio = bio
+        self.skip_existing = skip_existing
+        self.test_mode = test_mode
+        self.future: "Future[DatabaseResult]" = Future()
+
+
+class BioUpdateBatcher:
+    """
+    Group-commit writer for artist bio updates.
+
+    Workers call submit(), which enqueues the update and blocks until the
+    batch containing it has been committed, so callers still receive an
+    accurate per-row DatabaseResult. A single background thread collects
+    up to ``batch_size`` updates (waiting at most ``linger`` seconds for
+    stragglers), borrows one pooled connection, applies the batch and
+    returns the connection immediately. If a batch hits a permanent error,
+    its rows are retried one by one so a single bad row fails alone.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(
+        self,
+        pool: "ConnectionPool",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        linger: float = DEFAULT_LINGER_SECONDS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_delay: float = 1.0,
+    ):
+        """
+        Start the batcher thread.
+
+        Args:
+            pool: Database connection pool
+            batch_size: Maximum rows per transaction
+            linger: Seconds to wait for more rows before committing a partial batch
+            max_retries: Retries for transient database errors
+            retry_delay: Base delay between retries in seconds
+        """
+        self.pool = pool
+        self.batch_size = max(1, batch_size)
+        self.linger = linger
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="db-bio-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        artist_id: str,
+        bio: str,
+        skip_existing: bool = False,
+        test_mode: bool = False,
+        worker_id: str = "main",
+    ) -> DatabaseResult:
+        """
+        Queue a bio update and wait for its batch to commit.
+
+        Args:
+            artist_id: UUID of the artist
+            bio: Bio text to store
+            skip_existing: If True, only update if bio is NULL
+            test_mode: If True, use test table
+            worker_id: Worker thread identifier for logging
+
+        Returns:
+            DatabaseResult for this row
+        """
+        # Invalid IDs are rejected here and never reach the batch or retry path
+        canonical_id = canonical_uuid(artist_id)
+        if canonical_id is None:
+            return DatabaseResult(
+                success=False,
+                rows_affected=0,
+                error=f"Invalid UUID format: {artist_id}",
+            )
+
+        pending = _PendingUpdate(canonical_id, bio, skip_existing, test_mode)
+        with self._lock:
+            if self._closed:
+                return DatabaseResult(
+                    success=False, rows_affected=0, error="Bio update batcher is closed"
+                )
+            self._queue.put(pending)
+        logger.debug("[%s] Queued bio update for artist %s", worker_id, artist_id)
+        return pending.future.result()
+
+    def _run(self) -> None:
+        """Batcher thread: collect, commit and resolve batches until closed."""
+        batch: List[_PendingUpdate] = []
+        try:
+            while True:
+                item = self._queue.get()
+                if item is self._SENTINEL:
+                    return
+
+                batch = [item]
+                done = self._fill(batch)
+                self._commit(batch)
+                batch = []
+
+                if done:
+                    return
+        except Exception as e:
+            # Never leave workers blocked in submit() on a dead thread
+            logger.error(f"Bio update batcher stopped unexpectedly: {str(e)}")
+            self._fail_remaining(
+                batch,
+                DatabaseResult(
+                    success=False,
+                    rows_affected=0,
+                    error=f"Bio update batcher failed: {str(e)}",
+                ),
+            )
+
+    def _fill(self, batch: List[_PendingUpdate]) -> bool:
+        """
+        Add queued rows to a batch until it is full or the linger expires.
+
+        Args:
+            batch: Batch to extend in place
+
+        Returns:
+            True if the close sentinel was reached
+        """
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    item = self._queue.get(timeout=remaining)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                return False
+            if item is self._SENTINEL:
+                return True
+            batch.append(item)
+        return False
+
+    def _fail_remaining(
+        self, batch: List[_PendingUpdate], error: DatabaseResult
+    ) -> None:
+        """Close the batcher and resolve every unresolved row with an error."""
+        with self._lock:
+            self._closed = True
+
+        unresolved = list(batch)
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._SENTINEL:
+                unresolved.append(item)
+
+        for pending in unresolved:
+            if not pending.future.done():
+                pending.future.set_result(error)
+
+    def _commit(self, batch: List[_PendingUpdate]) -> None:
+        """Apply one batch, grouped by (skip_existing, test_mode)."""
+        groups: Dict[Tuple[bool, bool], List[_PendingUpdate]] = {}
+        for pending in batch:
+            groups.setdefault((pending.skip_existing, pending.test_mode), []).append(
+                pending
+            )
+
+        for (skip_existing, test_mode), rows in groups.items():
+            try:
+                updated_ids = self._apply_with_retry(rows, skip_existing, test_mode)
+            except Exception as e:
+                error_type = classify_database_error(e)
+                if error_type == "permanent" and len(rows) > 1:
+                    logger.warning(
+                        f"Batch of {len(rows)} bio updates failed ({error_type}): {str(e)} "
+                        f"- retrying rows individually"
+                    )
+                    self._apply_per_row(rows, skip_existing, test_mode)
+                    continue
+
+                error = DatabaseResult(
+                    success=False,
+                    rows_affected=0,
+                    error=f"Database operation failed ({error_type}): {str(e)}",
+                )
+                for pending in rows:
+                    pending.future.set_result(error)
+                continue
+
+            for pending in rows:
+                rows_affected = 1 if pending.artist_id in updated_ids else 0
+                pending.future.set_result(
+                    DatabaseResult(
+                        success=True, rows_affected=rows_affected, error=None
+                    )
+                )
+
+    def _apply_with_retry(
+        self,
+        rows: List[_PendingUpdate],
+        skip_existing: bool,
+        test_mode: bool,
+    ) -> Set[str]:
+        """Run the batch update, retrying transient errors with exponential backoff."""
+        updates = [(pending.artist_id, pending.bio) for pending in rows]
+
+        attempt = 0
+        while True:
+            connection = get_db_connection(self.pool)
+            if connection is None:
+                raise RuntimeError("Failed to get database connection")
+            try:
+                return update_artist_bios_batch(
+                    connection,
+                    updates,
+                    skip_existing=skip_existing,
+                    test_mode=test_mode,
+                )
+            except Exception as e:
+                error_type = classify_database_error(e)
+                if (
+                    error_type in ("permanent", "systemic")
+                    or attempt >= self.max_retries
+                ):
+                    raise
+                delay = self.retry_delay * (2**attempt)
+                logger.warning(
+                    f"Batch update failed (attempt {attempt + 1}/{self.max_retries + 1}): "
+                    f"{str(e)} - retrying in {delay:.1f}s"
+                )
+                last_error = e
+            finally:
+                release_db_connection(self.pool, connection)
+
+            if wait_for_retry(delay):
+                raise last_error
+            attempt += 1
+
+    def _apply_per_row(
+        self,
+        rows: List[_PendingUpdate],
+        skip_existing: bool,
+        test_mode: bool,
+    ) -> None:
+        """Apply rows one at a time on a single connection, resolving each future."""
+        connection = get_db_connection(self.pool)
+        if connection is None:
+            error = DatabaseResult(
+                success=False,
+                rows_affected=0,
+                error="Failed to get database connection",
+            )
+            for pending in rows:
+                pending.future.set_result(error)
+            return
+
+        try:
+            for pending in rows:
+                pending.future.set_result(
+                    update_artist_bio(
+                        connection=connection,
+                        artist_id=pending.artist_id,
+                        bio=pending.bio,
+                        skip_existing=skip_existing,
+                        test_mode=test_mode,
+                        worker_id="db-batch",
+                    )
+                )
+        finally:
+            release_db_connection(self.pool, connection)
+
+    def close(self) -> None:
+        """Commit everything still queued and stop the batcher thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(self._SENTINEL)
+        self._thread.join()
+
+    def __enter__(self) -> "BioUpdateBatcher":
+        """Enter context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Drain and stop the batcher on exit."""
+        self.close()
@@ -74,6 +74,7 @@ def create_database_config(
     connection_timeout: Optional[int] = None,
     query_timeout: Optional[int] = None,
     test_mode: bool = False,
+    synchronous_commit: bool = True,
 ) -> Optional[DatabaseConfig]:
     """
     Create a database configuration with validation.
@@ -85,6 +86,8 @@ def create_database_config(
         connection_timeout: Connection timeout in seconds (default: DEFAULT_CONNECTION_TIMEOUT)
         query_timeout: Query timeout in seconds (default: DEFAULT_QUERY_TIMEOUT)
         test_mode: Whether this is for testing (affects defaults)
+        synchronous_commit: If False, trade crash durability of the most
+            recent commits for commit latency
 
     Returns:
         DatabaseConfig object or None if validation fails
@@ -135,6 +138,7 @@ def create_database_config(
         max_overflow=final_max_overflow,
         connection_timeout=final_connection_timeout,
         query_timeout=final_query_timeout,
+        synchronous_commit=synchronous_commit,
     )
 
 
@@ -6,8 +6,11 @@ and connection pool cleanup for the artist bio generator application.
 """
 
 import logging
-from typing import Optional
+import threading
+import weakref
+from typing import Any, Dict, Optional
 
+from ..constants import DEFAULT_CONNECT_TIMEOUT
 from ..models import DatabaseConfig
 
 try:
@@ -21,13 +24,23 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Connections handed out by get_db_connection and not yet returned; guards
+# against returning the same connection to the pool twice
+_in_flight: "weakref.WeakSet" = weakref.WeakSet()
+_in_flight_lock = threading.Lock()
 
-def create_db_connection_pool(config: DatabaseConfig) -> Optional["ConnectionPool"]:
+
+def create_db_connection_pool(
+    config: DatabaseConfig, prewarm: bool = False
+) -> Optional["ConnectionPool"]:
     """
     Create a database connection pool.
 
     Args:
         config: Database configuration settings
+        prewarm: If True, open all pool_size connections at startup (for
+            per-row writes, where every worker borrows one); otherwise keep
+            one open and grow on demand
 
     Returns:
         Connection pool or None if psycopg3 not available
@@ -46,12 +59,25 @@ def create_db_connection_pool(config: DatabaseConfig) -> Optional["ConnectionPoo
             f"Creating database connection pool (size={config.pool_size}, max_overflow={config.max_overflow})"
         )
 
-        # Create connection pool with timeout configuration
+        # Create connection pool with timeout configuration. When prewarming,
+        # all pool_size connections are opened up front (in parallel by the
+        # pool's workers) so the first wave of workers doesn't pay the
+        # connect handshake; group commit borrows from a single thread, so
+        # it keeps one warm and leaves the rest of the server slots free.
+        # Fail fast on an unreachable server instead of hanging pool workers.
+        # Asynchronous commit skips the per-commit WAL flush wait for the
+        # whole session; a server crash can lose the last few bio updates.
+        connect_kwargs: Dict[str, Any] = {"connect_timeout": DEFAULT_CONNECT_TIMEOUT}
+        if not config.synchronous_commit:
+            connect_kwargs["options"] = "-c synchronous_commit=off"
+
         connection_pool = ConnectionPool(
             config.url,
-            min_size=1,  # Minimum connections to keep open
+            kwargs=connect_kwargs,
+            min_size=config.pool_size if prewarm else 1,  # Connections kept open
             max_size=config.pool_size + config.max_overflow,
             timeout=config.connection_timeout,  # Connection acquisition timeout
+            num_workers=min(4, config.pool_size),  # Parallel connection openers
             open=True,  # Open the pool immediately
         )
 
@@ -79,11 +105,13 @@ def get_db_connection(pool: "ConnectionPool") -> Optional["psycopg3.Connection"]
 
     try:
         # Log pool status before acquiring connection
-        if hasattr(pool, '_pool'):
+        if logger.isEnabledFor(logging.DEBUG) and hasattr(pool, '_pool'):
             available = pool._pool.qsize() if hasattr(pool._pool, 'qsize') else "unknown"
-            logger.debug(f"Connection pool status before acquire - Available: {available}")
+            logger.debug("Connection pool status before acquire - Available: %s", available)
         
         connection = pool.getconn()
+        with _in_flight_lock:
+            _in_flight.add(connection)
         logger.debug("Retrieved database connection from pool")
         return connection
 
@@ -98,19 +126,25 @@ def release_db_connection(pool: "ConnectionPool", connection: Optional["psycopg3
 
     Args:
         pool: Database connection pool
-        connection: Connection to return (ignored if None)
+        connection: Connection to return (ignored if None or already returned)
     """
     if pool is None or connection is None:
         return
 
+    with _in_flight_lock:
+        if connection not in _in_flight:
+            logger.warning("Ignoring release of a connection that is not checked out")
+            return
+        _in_flight.discard(connection)
+
     try:
         pool.putconn(connection)
         logger.debug("Returned database connection to pool")
         
         # Log pool status after releasing connection
-        if hasattr(pool, '_pool'):
+        if logger.isEnabledFor(logging.DEBUG) and hasattr(pool, '_pool'):
             available = pool._pool.qsize() if hasattr(pool._pool, 'qsize') else "unknown"
-            logger.debug(f"Connection pool status after release - Available: {available}")
+            logger.debug("Connection pool status after release - Available: %s", available)
     except Exception as e:
         logger.warning(f"Failed to return connection to pool: {str(e)}")
 
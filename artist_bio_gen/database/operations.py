@@ -6,9 +6,10 @@ retry logic with exponential backoff, and table name resolution.
 """
 
 import logging
-import time
+import random
+import threading
 from functools import wraps
-from typing import Optional
+from typing import Optional, Sequence, Set, Tuple
 
 from ..models import DatabaseResult
 from .utils import classify_database_error, validate_uuid
@@ -20,6 +21,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single jittered retry delay, in seconds
+_MAX_RETRY_DELAY = 60.0
+
+# Set on shutdown so workers waiting out a retry backoff give up immediately
+_shutdown_event = threading.Event()
+
+# Indexed by bool(test_mode)
+_TABLE_NAMES = ("artists", "test_artists")
+
 
 def get_table_name(test_mode: bool = False) -> str:
     """
@@ -31,7 +41,54 @@ def get_table_name(test_mode: bool = False) -> str:
     Returns:
         Table name string
     """
-    return "test_artists" if test_mode else "artists"
+    return _TABLE_NAMES[bool(test_mode)]
+
+
+# Statement text is fixed per (table, skip_existing) so the server can reuse
+# prepared plans across calls (see prepare=True at the execute sites)
+_UPDATE_SQL = {
+    (table_name, skip_existing): (
+        f"UPDATE {table_name} SET bio = %s WHERE id = %s"
+        + (" AND bio IS NULL" if skip_existing else "")
+    )
+    for table_name in _TABLE_NAMES
+    for skip_existing in (False, True)
+}
+
+_BATCH_UPDATE_SQL = {
+    (table_name, skip_existing): (
+        f"UPDATE {table_name} AS t SET bio = v.bio "
+        f"FROM unnest(%s::uuid[], %s::text[]) AS v(id, bio) "
+        f"WHERE t.id = v.id"
+        + (" AND t.bio IS NULL" if skip_existing else "")
+        + " RETURNING t.id"
+    )
+    for table_name in _TABLE_NAMES
+    for skip_existing in (False, True)
+}
+
+
+def cancel_retry_backoff() -> None:
+    """Abort pending and future database retry backoffs (e.g. on Ctrl+C)."""
+    _shutdown_event.set()
+
+
+def reset_retry_backoff() -> None:
+    """Re-enable database retries after a previous cancel_retry_backoff()."""
+    _shutdown_event.clear()
+
+
+def wait_for_retry(delay: float) -> bool:
+    """
+    Wait out a retry backoff unless shutdown is requested.
+
+    Args:
+        delay: Backoff delay in seconds
+
+    Returns:
+        True if the wait was cut short by cancel_retry_backoff()
+    """
+    return _shutdown_event.wait(delay)
 
 
 def retry_with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0):
@@ -70,12 +127,18 @@ def retry_with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0
                         )
                         break
 
-                    # Calculate delay with exponential backoff
-                    delay = base_delay * (2**attempt)
+                    # Exponential backoff with jitter so workers hitting the
+                    # same transient failure don't retry in lockstep
+                    delay = min(
+                        _MAX_RETRY_DELAY,
+                        random.uniform(base_delay, base_delay * 3 * (2**attempt)),
+                    )
                     logger.warning(
                         f"Database operation failed (attempt {attempt + 1}/{max_retries + 1}): {str(e)} - retrying in {delay:.1f}s"
                     )
-                    time.sleep(delay)
+                    if wait_for_retry(delay):
+                        logger.warning("Database retry abandoned: shutdown requested")
+                        break
 
             # If we get here, all retries failed - return error result
             error_type = classify_database_error(last_exception)
@@ -124,23 +187,17 @@ def update_artist_bio(
             success=False, rows_affected=0, error=f"Invalid UUID format: {artist_id}"
         )
 
-    table_name = get_table_name(test_mode)
+    table_name = _TABLE_NAMES[bool(test_mode)]
+    # skip_existing only updates rows whose bio is still NULL
+    sql = _UPDATE_SQL[table_name, bool(skip_existing)]
 
     try:
         cursor = connection.cursor()
 
-        # Build SQL query based on skip_existing flag
-        if skip_existing:
-            # Only update if bio is NULL
-            sql = f"UPDATE {table_name} SET bio = %s WHERE id = %s AND bio IS NULL"
-        else:
-            # Always update (overwrite existing)
-            sql = f"UPDATE {table_name} SET bio = %s WHERE id = %s"
-
-        logger.debug(f"[{worker_id}] Executing SQL: {sql}")
+        logger.debug("[%s] Executing SQL: %s", worker_id, sql)
 
-        # Execute the update
-        cursor.execute(sql, (bio, artist_id))
+        # Execute the update as a server-side prepared statement
+        cursor.execute(sql, (bio, artist_id), prepare=True)
         rows_affected = cursor.rowcount
 
         # Commit the transaction
@@ -148,12 +205,15 @@ def update_artist_bio(
 
         if rows_affected > 0:
             logger.debug(
-                f"[{worker_id}] Updated bio for artist {artist_id} in {table_name}"
+                "[%s] Updated bio for artist %s in %s", worker_id, artist_id, table_name
             )
             status = "updated"
         else:
             logger.debug(
-                f"[{worker_id}] No rows updated for artist {artist_id} in {table_name} (may not exist or already has bio)"
+                "[%s] No rows updated for artist %s in %s (may not exist or already has bio)",
+                worker_id,
+                artist_id,
+                table_name,
             )
             status = "skipped"
 
@@ -173,3 +233,72 @@ def update_artist_bio(
 
         # Let the retry decorator handle this
         raise
+
+
+def update_artist_bios_batch(
+    connection: "psycopg3.Connection",
+    updates: Sequence[Tuple[str, str]],
+    skip_existing: bool = False,
+    test_mode: bool = False,
+    worker_id: str = "db-batch",
+) -> Set[str]:
+    """
+    Update many artist bios in a single statement and transaction.
+
+    All rows are sent as two parallel arrays and applied with one
+    ``UPDATE ... FROM unnest(...)`` followed by a single commit, so a
+    batch costs one round-trip and one WAL flush instead of one per row.
+
+    Args:
+        connection: Database connection
+        updates: Sequence of (artist_id, bio) pairs; IDs must be valid UUIDs
+        skip_existing: If True, only update rows whose bio is NULL
+        test_mode: If True, use test table
+        worker_id: Worker thread identifier for logging
+
+    Returns:
+        Set of canonical (lower-case, hyphenated) artist IDs that were updated
+
+    Raises:
+        Exception: Any database error, after rolling back the transaction
+    """
+    if not updates:
+        return set()
+
+    table_name = _TABLE_NAMES[bool(test_mode)]
+    artist_ids = [artist_id for artist_id, _ in updates]
+    bios = [bio for _, bio in updates]
+
+    sql = _BATCH_UPDATE_SQL[table_name, bool(skip_existing)]
+
+    try:
+        cursor = connection.cursor()
+        logger.debug(
+            "[%s] Executing batch SQL for %d rows: %s", worker_id, len(updates), sql
+        )
+
+        cursor.execute(sql, (artist_ids, bios), prepare=True)
+        updated_ids = {str(row[0]).lower() for row in cursor.fetchall()}
+
+        connection.commit()
+
+        logger.debug(
+            "[%s] Batch updated %d/%d bios in %s",
+            worker_id,
+            len(updated_ids),
+            len(updates),
+            table_name,
+        )
+        return updated_ids
+
+    except Exception as e:
+        try:
+            connection.rollback()
+        except Exception:
+            pass  # Ignore rollback errors
+
+        error_type = classify_database_error(e)
+        logger.error(
+            f"[{worker_id}] Database error ({error_type}) in batch update of {len(updates)} rows: {str(e)}"
+        )
+        raise
@@ -5,7 +5,65 @@ This module provides utility functions for database operations including
 error classification and UUID validation.
 """
 
+import re
 import uuid
+from typing import Optional
+
+# Canonical 8-4-4-4-12 form; anything else falls back to uuid.UUID parsing
+_CANONICAL_UUID_RE = re.compile(
+    r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.IGNORECASE
+)
+
+# Permanent errors - don't retry these
+_PERMANENT_ERROR_INDICATORS = (
+    "invalid uuid",
+    "constraint violation",
+    "foreign key constraint",
+    "check constraint",
+    "not null violation",
+    "duplicate key",
+    "relation does not exist",  # Table doesn't exist
+    "column does not exist",  # Column doesn't exist
+)
+
+# Systemic errors - abort processing
+_SYSTEMIC_ERROR_INDICATORS = (
+    "authentication failed",
+    "permission denied",
+    "role does not exist",
+    "database does not exist",
+    "ssl required",
+    "password authentication failed",
+)
+
+# SQLSTATE codes carried by psycopg errors; checked before the message text
+_PERMANENT_SQLSTATES = frozenset(
+    {
+        "22P02",  # invalid_text_representation (e.g. malformed UUID)
+        "23502",  # not_null_violation
+        "23503",  # foreign_key_violation
+        "23505",  # unique_violation
+        "23514",  # check_violation
+        "42P01",  # undefined_table
+        "42703",  # undefined_column
+    }
+)
+_SYSTEMIC_SQLSTATES = frozenset(
+    {
+        "28000",  # invalid_authorization_specification
+        "28P01",  # invalid_password
+        "3D000",  # invalid_catalog_name (database does not exist)
+        "42501",  # insufficient_privilege
+    }
+)
+
+# One case-insensitive alternation per category: a single scan of the message
+_PERMANENT_ERROR_RE = re.compile(
+    "|".join(map(re.escape, _PERMANENT_ERROR_INDICATORS)), re.IGNORECASE
+)
+_SYSTEMIC_ERROR_RE = re.compile(
+    "|".join(map(re.escape, _SYSTEMIC_ERROR_INDICATORS)), re.IGNORECASE
+)
 
 
 def classify_database_error(exception: Exception) -> str:
@@ -18,37 +76,22 @@ def classify_database_error(exception: Exception) -> str:
     Returns:
         Error type: "permanent", "transient", or "systemic"
     """
-    error_str = str(exception).lower()
-
-    # Permanent errors - don't retry these
-    permanent_indicators = [
-        "invalid uuid",
-        "constraint violation",
-        "foreign key constraint",
-        "check constraint",
-        "not null violation",
-        "duplicate key",
-        "relation does not exist",  # Table doesn't exist
-        "column does not exist",  # Column doesn't exist
-    ]
-
-    for indicator in permanent_indicators:
-        if indicator in error_str:
-            return "permanent"
-
-    # Systemic errors - abort processing
-    systemic_indicators = [
-        "authentication failed",
-        "permission denied",
-        "role does not exist",
-        "database does not exist",
-        "ssl required",
-        "password authentication failed",
-    ]
-
-    for indicator in systemic_indicators:
-        if indicator in error_str:
-            return "systemic"
+    # psycopg errors expose their SQLSTATE; classify by code without
+    # formatting the message when it is one we know
+    sqlstate = getattr(exception, "sqlstate", None)
+    if sqlstate in _PERMANENT_SQLSTATES:
+        return "permanent"
+    if sqlstate in _SYSTEMIC_SQLSTATES:
+        return "systemic"
+
+    error_str = str(exception)
+
+    # Permanent errors win over systemic ones when a message matches both
+    if _PERMANENT_ERROR_RE.search(error_str):
+        return "permanent"
+
+    if _SYSTEMIC_ERROR_RE.search(error_str):
+        return "systemic"
 
     # Default to transient - can retry these
     # Includes: connection timeout, temporary network issues, deadlocks, etc.
@@ -59,14 +102,47 @@ def validate_uuid(uuid_string: str) -> bool:
     """
     Validate that a string is a valid UUID format.
 
+    Canonical hyphenated UUIDs are accepted by a precompiled regex without
+    building a UUID object. Other spellings that uuid.UUID understands
+    (braces, urn:uuid: prefix, no hyphens) are still accepted via the slow path.
+
     Args:
         uuid_string: String to validate
 
     Returns:
         True if valid UUID, False otherwise
     """
+    if not isinstance(uuid_string, str):
+        return False
+    if _CANONICAL_UUID_RE.match(uuid_string):
+        return True
+
     try:
         uuid.UUID(uuid_string)
         return True
     except (ValueError, TypeError):
         return False
+
+
+def canonical_uuid(uuid_string: str) -> Optional[str]:
+    """
+    Normalize a UUID string to lower-case hyphenated form.
+
+    Uses the same regex fast path as validate_uuid for input that is already
+    hyphenated, falling back to uuid.UUID for other spellings.
+
+    Args:
+        uuid_string: String to normalize
+
+    Returns:
+        Canonical UUID string, or None if the input is not a valid UUID
+    """
+    if not isinstance(uuid_string, str):
+        return None
+    if _CANONICAL_UUID_RE.match(uuid_string):
+        return uuid_string.lower()
+
+    try:
+        return str(uuid.UUID(uuid_string))
+    except (ValueError, TypeError):
+        return None
@@ -19,6 +19,8 @@ class DatabaseConfig(NamedTuple):
         max_overflow: Maximum overflow connections beyond pool_size
         connection_timeout: Timeout for getting connections (seconds)
         query_timeout: Timeout for individual queries (seconds)
+        synchronous_commit: If False, sessions commit without waiting for the
+            WAL flush (faster; a crash can lose the last few commits)
     """
 
     url: str
@@ -26,6 +28,7 @@ class DatabaseConfig(NamedTuple):
     max_overflow: int = 8  # Allow burst connections
     connection_timeout: int = 30  # seconds
     query_timeout: int = 60  # seconds
+    synchronous_commit: bool = True
 
 
 class DatabaseResult(NamedTuple):
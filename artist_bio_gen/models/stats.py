@@ -6,7 +6,7 @@ This module contains data structures related to processing statistics
 and performance metrics.
 """
 
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 
 class ProcessingStats(NamedTuple):
@@ -24,6 +24,16 @@ class ProcessingStats(NamedTuple):
         total_duration: Total processing duration in seconds
         avg_time_per_artist: Average processing time per artist
         api_calls_per_second: API calls per second rate
+        end_time_str: Pre-formatted local end time ("%Y-%m-%d %H:%M:%S")
+        total_duration_str: Pre-formatted whole-second duration ("H:MM:SS")
+        success_rate: Successful calls as a percentage of total artists
+        processing_efficiency: Successful share in percent (None without artists)
+        successful_time: Share of the duration spent on successful calls
+            (None when the duration is zero)
+        failed_time: Share of the duration spent on failed calls
+            (None when the duration is zero)
+        estimated_total_time: Projected duration for all artists
+            (None without successful calls)
     """
 
     total_artists: int
@@ -36,3 +46,10 @@ class ProcessingStats(NamedTuple):
     total_duration: float
     avg_time_per_artist: float
     api_calls_per_second: float
+    end_time_str: Optional[str] = None
+    total_duration_str: Optional[str] = None
+    success_rate: Optional[float] = None
+    processing_efficiency: Optional[float] = None
+    successful_time: Optional[float] = None
+    failed_time: Optional[float] = None
+    estimated_total_time: Optional[float] = None
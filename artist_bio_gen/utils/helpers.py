@@ -5,8 +5,14 @@ This module provides common utility functions that are used
 across multiple modules in the application.
 """
 
+from functools import lru_cache
 
-def create_progress_bar(current: int, total: int, width: int = 30) -> str:
+DEFAULT_PROGRESS_BAR_WIDTH = 30
+
+
+def create_progress_bar(
+    current: int, total: int, width: int = DEFAULT_PROGRESS_BAR_WIDTH
+) -> str:
     """
     Create a text-based progress bar.
 
@@ -22,6 +28,20 @@ def create_progress_bar(current: int, total: int, width: int = 30) -> str:
         return "[" + " " * width + "]"
 
     percentage = current / total
-    filled = int(width * percentage)
-    bar = "█" * filled + "░" * (width - filled)
-    return f"[{bar}]"
+    filled = min(max(int(width * percentage), 0), width)
+    if width == DEFAULT_PROGRESS_BAR_WIDTH:
+        return _DEFAULT_PROGRESS_BAR_FRAMES[filled]
+    return _progress_bar_frame(filled, width)
+
+
+@lru_cache(maxsize=256)
+def _progress_bar_frame(filled: int, width: int) -> str:
+    """Render (and memoize) a progress bar with ``filled`` of ``width`` cells."""
+    return "[" + "█" * filled + "░" * (width - filled) + "]"
+
+
+# Only width + 1 distinct bars exist, so build the default ones once at import
+_DEFAULT_PROGRESS_BAR_FRAMES = tuple(
+    _progress_bar_frame(filled, DEFAULT_PROGRESS_BAR_WIDTH)
+    for filled in range(DEFAULT_PROGRESS_BAR_WIDTH + 1)
+)
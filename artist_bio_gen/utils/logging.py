@@ -5,20 +5,47 @@ This module provides centralized logging configuration and utilities
 to ensure consistent logging behavior across the application.
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
+import queue
 import threading
 import time
 from datetime import datetime
 from typing import Optional
 
+# Background listener that owns the real stream handler (see setup_logging)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(verbose: bool = False):
-    """Setup logging configuration with appropriate level and format."""
+    """
+    Setup logging configuration with appropriate level and format.
+
+    Like logging.basicConfig, this only configures the root logger when it
+    has no handlers yet. Records are handed to a QueueHandler and written to
+    stderr by a background QueueListener, so worker threads logging
+    completions only pay for an enqueue instead of contending on the stream
+    handler's lock. The listener is stopped (and the queue drained) at exit.
+    """
+    global _queue_listener
+
     level = logging.DEBUG if verbose else logging.INFO
     format_string = "%(asctime)s - %(levelname)s - %(message)s"
 
-    logging.basicConfig(level=level, format=format_string, datefmt="%Y-%m-%d %H:%M:%S")
+    root = logging.getLogger()
+    if not root.handlers:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(format_string, datefmt="%Y-%m-%d %H:%M:%S"))
+
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        _queue_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(level)
 
     # Set specific logger levels
     logging.getLogger("openai").setLevel(logging.WARNING)  # Reduce OpenAI client noise
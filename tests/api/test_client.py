@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for OpenAI client creation.
+"""
+
+import subprocess
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from artist_bio_gen.api.client import _create_http2_client, create_openai_client
+
+
+class TestLazyOpenAIImport(unittest.TestCase):
+    """Test that the openai package is only imported when a client is built."""
+
+    def test_importing_cli_does_not_import_openai(self):
+        """Test the CLI module imports without pulling in openai."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, artist_bio_gen.cli.main; print('openai' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+class TestHttp2Client(unittest.TestCase):
+    """Test the optional HTTP/2 transport for the OpenAI client."""
+
+    @patch("artist_bio_gen.api.client.importlib.util.find_spec", return_value=None)
+    def test_falls_back_to_sdk_default_without_h2(self, mock_find_spec):
+        """Test no custom client is built when h2 is not installed."""
+        self.assertIsNone(_create_http2_client())
+        mock_find_spec.assert_called_once_with("h2")
+
+    @patch(
+        "artist_bio_gen.api.client.importlib.util.find_spec", return_value=MagicMock()
+    )
+    def test_enables_http2_when_h2_installed(self, mock_find_spec):
+        """Test the SDK's default httpx client is built with http2=True."""
+        with patch("openai.DefaultHttpxClient") as mock_client_cls:
+            client = _create_http2_client()
+
+        mock_client_cls.assert_called_once_with(http2=True)
+        self.assertIs(client, mock_client_cls.return_value)
+
+
+class TestCreateOpenAIClient(unittest.TestCase):
+    """Test that HTTP/2 is only used when explicitly requested."""
+
+    @patch("artist_bio_gen.api.client.Env.current")
+    @patch("artist_bio_gen.api.client._create_http2_client")
+    def test_uses_sdk_default_client_without_flag(self, mock_http2, mock_env):
+        """Test no HTTP/2 client is built unless http2=True."""
+        with patch("openai.OpenAI") as mock_openai:
+            create_openai_client()
+
+        mock_http2.assert_not_called()
+        self.assertIsNone(mock_openai.call_args.kwargs["http_client"])
+
+    @patch("artist_bio_gen.api.client.Env.current")
+    @patch("artist_bio_gen.api.client._create_http2_client")
+    def test_passes_http2_client_when_requested(self, mock_http2, mock_env):
+        """Test http2=True hands the HTTP/2 client to the SDK."""
+        with patch("openai.OpenAI") as mock_openai:
+            create_openai_client(http2=True)
+
+        mock_http2.assert_called_once_with()
+        self.assertIs(
+            mock_openai.call_args.kwargs["http_client"], mock_http2.return_value
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
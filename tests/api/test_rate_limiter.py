@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the client-side token bucket rate limiter.
+"""
+
+import threading
+import unittest
+
+from artist_bio_gen.api.quota import TokenBucket
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def time(self):
+        with self._lock:
+            return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test TokenBucket pacing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+
+    def _bucket(self, rpm=None, tpm=None):
+        return TokenBucket(
+            rpm=rpm, tpm=tpm, clock=self.clock.time, sleep=self.clock.sleep
+        )
+
+    def test_paces_requests_to_rpm(self):
+        """Test back-to-back requests are spaced at 60 / rpm seconds."""
+        bucket = self._bucket(rpm=60)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        self.assertEqual(waits[0], 0.0)
+        for wait in waits[1:]:
+            self.assertAlmostEqual(wait, 1.0)
+        self.assertAlmostEqual(self.clock.now, 3.0)
+
+    def test_refills_over_time(self):
+        """Test idle time refills the bucket."""
+        bucket = self._bucket(rpm=60)
+        bucket.acquire()
+
+        self.clock.now += 5.0
+
+        self.assertEqual(bucket.acquire(), 0.0)
+
+    def test_burst_capped_at_one_second(self):
+        """Test idle time does not accumulate more than one second of burst."""
+        bucket = self._bucket(rpm=120)
+        self.clock.now += 60.0
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 0.5)
+
+    def test_paces_tokens_to_tpm(self):
+        """Test estimated tokens are paced against the TPM budget."""
+        bucket = self._bucket(tpm=6000)  # 100 tokens per second
+
+        self.assertEqual(bucket.acquire(estimated_tokens=100), 0.0)
+        self.assertAlmostEqual(bucket.acquire(estimated_tokens=200), 2.0)
+
+    def test_concurrent_acquires_are_spaced(self):
+        """Test concurrent callers reserve distinct slots."""
+        bucket = TokenBucket(rpm=60, clock=lambda: 0.0, sleep=lambda seconds: None)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            wait = bucket.acquire()
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(waits), [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    def test_invalid_limits(self):
+        """Test non-positive limits are rejected."""
+        with self.assertRaises(ValueError):
+            TokenBucket(rpm=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(tpm=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,7 @@ from artist_bio_gen.cli import (
     create_argument_parser,
     main,
 )
+from artist_bio_gen.cli.main import _database_pool_size
 
 # Import utilities - none needed for current tests
 
@@ -122,6 +123,50 @@ class TestArgumentParser(unittest.TestCase):
         args = self.parser.parse_args(["--input-file", "test.csv"])
         self.assertFalse(args.dry_run)
 
+    def test_cache_arguments(self):
+        """Test response cache arguments and defaults."""
+        args = self.parser.parse_args(["--input-file", "test.csv"])
+        self.assertIsNone(args.cache_path)
+        self.assertEqual(args.cache_policy, "enabled")
+
+        args = self.parser.parse_args(
+            ["--input-file", "test.csv", "--cache-path", "cache.sqlite", "--cache-policy", "replay"]
+        )
+        self.assertEqual(args.cache_path, "cache.sqlite")
+        self.assertEqual(args.cache_policy, "replay")
+
+    def test_print_responses_argument(self):
+        """Test bios are echoed by default and --no-print-responses disables it."""
+        args = self.parser.parse_args(["--input-file", "test.csv"])
+        self.assertTrue(args.print_responses)
+
+        args = self.parser.parse_args(["--input-file", "test.csv", "--no-print-responses"])
+        self.assertFalse(args.print_responses)
+
+    def test_db_batch_size_argument(self):
+        """Test the database batch size flag and its default."""
+        args = self.parser.parse_args(["--input-file", "test.csv"])
+        self.assertEqual(args.db_batch_size, 50)
+
+        args = self.parser.parse_args(["--input-file", "test.csv", "--db-batch-size", "1"])
+        self.assertEqual(args.db_batch_size, 1)
+
+    def test_openai_http2_argument(self):
+        """Test HTTP/2 for the OpenAI client is opt-in."""
+        args = self.parser.parse_args(["--input-file", "test.csv"])
+        self.assertFalse(args.openai_http2)
+
+        args = self.parser.parse_args(["--input-file", "test.csv", "--openai-http2"])
+        self.assertTrue(args.openai_http2)
+
+    def test_db_async_commit_argument(self):
+        """Test the asynchronous commit flag defaults to durable commits."""
+        args = self.parser.parse_args(["--input-file", "test.csv"])
+        self.assertFalse(args.db_async_commit)
+
+        args = self.parser.parse_args(["--input-file", "test.csv", "--db-async-commit"])
+        self.assertTrue(args.db_async_commit)
+
     def test_all_arguments_together(self):
         """Test parsing all arguments together."""
         args = self.parser.parse_args(
@@ -204,6 +249,19 @@ class TestMainFunction(unittest.TestCase):
         # Detailed logging verification would require more complex setup
 
 
+class TestDatabasePoolSizing(unittest.TestCase):
+    """Test cases for sizing the connection pool from the write mode."""
+
+    def test_batched_writes_use_a_small_pool(self):
+        """Test group commit needs only a couple of connections at any worker count."""
+        self.assertEqual(_database_pool_size(max_workers=32, db_batch_size=50), 2)
+        self.assertEqual(_database_pool_size(max_workers=4, db_batch_size=2), 2)
+
+    def test_per_row_writes_use_one_connection_per_worker(self):
+        """Test per-row writes size the pool to the worker count."""
+        self.assertEqual(_database_pool_size(max_workers=32, db_batch_size=1), 32)
+
+
 class TestEnvironmentVariableHandling(unittest.TestCase):
     """Test cases for environment variable handling."""
 
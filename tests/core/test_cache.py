@@ -0,0 +1,110 @@
+"""
+Unit tests for the response cache.
+"""
+
+import os
+import tempfile
+import unittest
+
+from artist_bio_gen.core.cache import ResponseCache
+from artist_bio_gen.models import ApiResponse, ArtistData
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for ResponseCache class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.temp_dir.name, "cache", "responses.sqlite")
+        self.artist = ArtistData("123", "Test Artist", "Extra data")
+        self.response = ApiResponse(
+            artist_id="123",
+            artist_name="Test Artist",
+            artist_data="Extra data",
+            response_text="Bio text",
+            response_id="resp_123",
+            created=1234567890,
+            db_status="updated",
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        """Test stored responses are returned on lookup."""
+        key = ResponseCache.make_key("prompt", "v1", self.artist)
+        with ResponseCache(self.cache_path) as cache:
+            self.assertIsNone(cache.get(key, self.artist))
+            cache.put(key, self.response)
+            cached = cache.get(key, self.artist)
+
+        self.assertEqual(cached.response_text, "Bio text")
+        self.assertEqual(cached.response_id, "resp_123")
+        self.assertEqual(cached.created, 1234567890)
+        self.assertEqual(cached.artist_id, "123")
+        self.assertIsNone(cached.error)
+
+    def test_persists_across_instances(self):
+        """Test entries survive reopening the cache file."""
+        key = ResponseCache.make_key("prompt", None, self.artist)
+        with ResponseCache(self.cache_path) as cache:
+            cache.put(key, self.response)
+
+        with ResponseCache(self.cache_path, policy="read-only") as cache:
+            self.assertIsNotNone(cache.get(key, self.artist))
+
+    def test_key_depends_on_payload(self):
+        """Test cache key changes with prompt, version and artist data."""
+        base = ResponseCache.make_key("prompt", "v1", self.artist)
+
+        self.assertEqual(base, ResponseCache.make_key("prompt", "v1", self.artist))
+        self.assertNotEqual(base, ResponseCache.make_key("other", "v1", self.artist))
+        self.assertNotEqual(base, ResponseCache.make_key("prompt", "v2", self.artist))
+        self.assertNotEqual(
+            base,
+            ResponseCache.make_key(
+                "prompt", "v1", self.artist._replace(data="Changed")
+            ),
+        )
+
+    def test_errors_are_not_stored(self):
+        """Test failed responses are never cached."""
+        key = ResponseCache.make_key("prompt", "v1", self.artist)
+        with ResponseCache(self.cache_path) as cache:
+            cache.put(key, self.response._replace(error="boom"))
+            self.assertIsNone(cache.get(key, self.artist))
+
+    def test_database_failures_are_not_stored(self):
+        """Test responses whose DB write failed are retried on the next run."""
+        key = ResponseCache.make_key("prompt", "v1", self.artist)
+        with ResponseCache(self.cache_path) as cache:
+            cache.put(key, self.response._replace(db_status="error"))
+            self.assertIsNone(cache.get(key, self.artist))
+
+    def test_read_only_policy_does_not_store(self):
+        """Test read-only caches serve hits but ignore writes."""
+        key = ResponseCache.make_key("prompt", "v1", self.artist)
+        with ResponseCache(self.cache_path, policy="read-only") as cache:
+            self.assertTrue(cache.readable)
+            self.assertFalse(cache.writable)
+            cache.put(key, self.response)
+            self.assertIsNone(cache.get(key, self.artist))
+
+    def test_disabled_policy_skips_database(self):
+        """Test disabled caches never touch the filesystem."""
+        cache = ResponseCache(self.cache_path, policy="disabled")
+
+        self.assertFalse(cache.readable)
+        self.assertFalse(os.path.exists(self.cache_path))
+        cache.close()
+
+    def test_invalid_policy(self):
+        """Test unknown policies are rejected."""
+        with self.assertRaises(ValueError):
+            ResponseCache(self.cache_path, policy="sometimes")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,15 +4,25 @@ Unit tests for processing orchestration components.
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock, call
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 import time
 import threading
 
-from artist_bio_gen.core.orchestrator import ProcessingOrchestrator
+from artist_bio_gen.core.orchestrator import _STDOUT_BATCH_SIZE, ProcessingOrchestrator
 from artist_bio_gen.core.resources import ProcessingContext
 from artist_bio_gen.models import ArtistData, ApiResponse
 
 
+def _completed_future(result=None, exception=None):
+    """Build an already-finished future; done callbacks run on attach."""
+    future = Future()
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+
 class TestProcessingOrchestrator(unittest.TestCase):
     """Test cases for ProcessingOrchestrator class."""
 
@@ -25,6 +35,10 @@ class TestProcessingOrchestrator(unittest.TestCase):
         self.mock_context.db_pool = Mock()
         self.mock_context.quota_monitor = Mock()
         self.mock_context.pause_controller = Mock()
+        self.mock_context.throttle = None
+        self.mock_context.response_cache = None
+        self.mock_context.rate_limiter = None
+        self.mock_context.bio_batcher = None
 
         # Create test artists
         self.test_artists = [
@@ -56,11 +70,10 @@ class TestProcessingOrchestrator(unittest.TestCase):
         self.assertIsNotNone(self.orchestrator.timer_manager)
 
     @patch('artist_bio_gen.core.orchestrator.ThreadPoolExecutor')
-    @patch('artist_bio_gen.core.orchestrator.as_completed')
     @patch('artist_bio_gen.core.orchestrator.call_openai_api')
     @patch('artist_bio_gen.core.orchestrator.ProgressTracker')
     def test_process_artists_success(
-        self, mock_progress_tracker_class, mock_call_api, mock_as_completed, mock_executor_class
+        self, mock_progress_tracker_class, mock_call_api, mock_executor_class
     ):
         """Test successful processing of artists."""
         # Setup mock progress tracker
@@ -76,7 +89,6 @@ class TestProcessingOrchestrator(unittest.TestCase):
         # Setup mock futures
         mock_futures = []
         for i, artist in enumerate(self.test_artists):
-            future = Mock(spec=Future)
             api_response = ApiResponse(
                 artist_id=artist.artist_id,
                 artist_name=artist.name,
@@ -86,17 +98,14 @@ class TestProcessingOrchestrator(unittest.TestCase):
                 created=int(time.time()),
                 error=None
             )
-            future.result.return_value = (api_response, 1.0)
-            mock_futures.append(future)
+            mock_futures.append(_completed_future((api_response, 1.0)))
 
         # Configure executor.submit to return futures
         mock_executor.submit.side_effect = mock_futures
 
-        # Configure as_completed to return futures in order
-        mock_as_completed.return_value = iter(mock_futures)
 
         # Process artists
-        with patch('artist_bio_gen.core.orchestrator.append_jsonl_response'):
+        with patch('artist_bio_gen.core.orchestrator.JsonlWriter'):
             successful, failed = self.orchestrator.process_artists(self.test_artists)
 
         # Verify results
@@ -110,10 +119,185 @@ class TestProcessingOrchestrator(unittest.TestCase):
         self.orchestrator.timer_manager.cancel_all()
 
     @patch('artist_bio_gen.core.orchestrator.ThreadPoolExecutor')
-    @patch('artist_bio_gen.core.orchestrator.as_completed')
+    @patch('artist_bio_gen.core.orchestrator.ProgressTracker')
+    def test_process_artists_serves_cache_hits(
+        self, mock_progress_tracker_class, mock_executor_class
+    ):
+        """Test cached artists are answered without submitting tasks."""
+        mock_tracker = Mock()
+        mock_tracker.should_log_summary.return_value = False
+        mock_tracker.get_stats.return_value = (5, 0)
+        mock_progress_tracker_class.return_value = mock_tracker
+
+        mock_executor = MagicMock()
+        mock_executor_class.return_value.__enter__.return_value = mock_executor
+
+        def submit(fn, client, artist, *args):
+            return _completed_future((
+                ApiResponse(
+                    artist_id=artist.artist_id,
+                    artist_name=artist.name,
+                    artist_data=artist.data,
+                    response_text="Fresh bio",
+                    response_id="resp_fresh",
+                    created=0,
+                ),
+                1.0,
+            ))
+
+        mock_executor.submit.side_effect = submit
+
+        cached_ids = {"id_0", "id_1", "id_2"}
+        cache = Mock()
+        cache.readable = True
+        cache.replay_only = False
+        cache.make_key.side_effect = lambda prompt_id, version, artist: artist.artist_id
+        cache.get.side_effect = lambda key, artist: (
+            ApiResponse(
+                artist_id=artist.artist_id,
+                artist_name=artist.name,
+                artist_data=artist.data,
+                response_text="Cached bio",
+                response_id="resp_cached",
+                created=0,
+            )
+            if key in cached_ids
+            else None
+        )
+        self.mock_context.response_cache = cache
+        self.mock_context.quota_monitor = None
+
+        with patch('artist_bio_gen.core.orchestrator.JsonlWriter') as mock_writer_class, \
+             patch('sys.stdout'):
+            self.orchestrator.process_artists(self.test_artists)
+
+        mock_writer = mock_writer_class.return_value.__enter__.return_value
+        self.assertEqual(mock_executor.submit.call_count, 2)
+        self.assertEqual(mock_writer.write_response.call_count, 5)
+        submitted = [call.args[2].artist_id for call in mock_executor.submit.call_args_list]
+        self.assertEqual(submitted, ["id_3", "id_4"])
+        # Only fresh responses are written back to the cache
+        stored = [call.args[0] for call in cache.put.call_args_list]
+        self.assertEqual(sorted(stored), ["id_3", "id_4"])
+
+    @patch('artist_bio_gen.core.orchestrator.ThreadPoolExecutor')
+    @patch('artist_bio_gen.core.orchestrator.ProgressTracker')
+    def test_process_artists_consumes_generator_lazily(
+        self, mock_progress_tracker_class, mock_executor_class
+    ):
+        """Test a generator is pulled no further ahead than the in-flight window."""
+        mock_tracker = Mock()
+        mock_tracker.should_log_summary.return_value = False
+        mock_tracker.get_stats.return_value = (5, 0)
+        mock_progress_tracker_class.return_value = mock_tracker
+
+        pulled = []
+
+        def generate():
+            for artist in self.test_artists:
+                pulled.append(artist.artist_id)
+                yield artist
+
+        submitted_when = []
+
+        def submit(fn, client, artist, *args):
+            submitted_when.append(len(pulled))
+            return _completed_future((
+                ApiResponse(
+                    artist_id=artist.artist_id,
+                    artist_name=artist.name,
+                    artist_data=artist.data,
+                    response_text="Bio",
+                    response_id="resp",
+                    created=0,
+                ),
+                1.0,
+            ))
+
+        mock_executor = MagicMock()
+        mock_executor.submit.side_effect = submit
+        mock_executor_class.return_value.__enter__.return_value = mock_executor
+
+        with patch('artist_bio_gen.core.orchestrator.JsonlWriter'), patch('sys.stdout'):
+            self.orchestrator.process_artists(generate(), total_artists=5)
+
+        self.assertEqual(mock_progress_tracker_class.call_args.args, (5,))
+        # Each artist is pulled just before its own submission
+        self.assertEqual(submitted_when, [1, 2, 3, 4, 5])
+
+    @patch('artist_bio_gen.core.orchestrator.release_db_connection')
+    @patch('artist_bio_gen.core.orchestrator.get_db_connection')
+    @patch('artist_bio_gen.core.orchestrator.update_artist_bios_batch')
+    def test_cache_hits_are_written_to_database(
+        self, mock_batch_update, mock_get_connection, mock_release_connection
+    ):
+        """Test cached bios reach the database in one batch under canonical IDs."""
+        updated_id = "11111111-1111-1111-1111-111111111111"
+        skipped_id = "22222222-2222-2222-2222-222222222222"
+        artists = [
+            ArtistData(artist_id=updated_id.upper(), name="Updated"),
+            ArtistData(artist_id=skipped_id, name="Skipped"),
+            ArtistData(artist_id="not-a-uuid", name="Invalid"),
+        ]
+        hits = [
+            (
+                artist,
+                ApiResponse(
+                    artist_id=artist.artist_id,
+                    artist_name=artist.name,
+                    artist_data=None,
+                    response_text=f"Cached bio for {artist.name}",
+                    response_id="resp_cached",
+                    created=0,
+                    db_status="null",
+                ),
+            )
+            for artist in artists
+        ]
+        mock_batch_update.return_value = {updated_id}
+
+        persisted = self.orchestrator._persist_cached(hits)
+
+        mock_batch_update.assert_called_once()
+        updates = mock_batch_update.call_args[0][1]
+        self.assertEqual(
+            updates,
+            [(updated_id, "Cached bio for Updated"), (skipped_id, "Cached bio for Skipped")],
+        )
+        mock_release_connection.assert_called_once()
+        self.assertEqual(
+            [response.db_status for _, response in persisted],
+            ["updated", "skipped", "error"],
+        )
+
+    @patch('artist_bio_gen.core.orchestrator.release_db_connection')
+    @patch('artist_bio_gen.core.orchestrator.get_db_connection')
+    @patch('artist_bio_gen.core.orchestrator.update_artist_bios_batch')
+    def test_cache_hit_database_failure_marks_error(
+        self, mock_batch_update, mock_get_connection, mock_release_connection
+    ):
+        """Test a failed batch marks every cached hit as a database error."""
+        artist = ArtistData(artist_id="11111111-1111-1111-1111-111111111111", name="A")
+        cached = ApiResponse(
+            artist_id=artist.artist_id,
+            artist_name=artist.name,
+            artist_data=None,
+            response_text="Cached bio",
+            response_id="resp_cached",
+            created=0,
+            db_status="null",
+        )
+        mock_batch_update.side_effect = Exception("connection lost")
+
+        persisted = self.orchestrator._persist_cached([(artist, cached)])
+
+        self.assertEqual(persisted[0][1].db_status, "error")
+        mock_release_connection.assert_called_once()
+
+    @patch('artist_bio_gen.core.orchestrator.ThreadPoolExecutor')
     @patch('artist_bio_gen.core.orchestrator.ProgressTracker')
     def test_process_artists_with_errors(
-        self, mock_progress_tracker_class, mock_as_completed, mock_executor_class
+        self, mock_progress_tracker_class, mock_executor_class
     ):
         """Test processing with some errors."""
         # Setup mock progress tracker
@@ -129,8 +313,6 @@ class TestProcessingOrchestrator(unittest.TestCase):
         # Setup mock futures with one error
         mock_futures = []
         for i, artist in enumerate(self.test_artists[:3]):
-            future = Mock(spec=Future)
-
             if i == 1:
                 # Second artist fails
                 api_response = ApiResponse(
@@ -154,14 +336,12 @@ class TestProcessingOrchestrator(unittest.TestCase):
                     error=None
                 )
 
-            future.result.return_value = (api_response, 1.0)
-            mock_futures.append(future)
+            mock_futures.append(_completed_future((api_response, 1.0)))
 
         mock_executor.submit.side_effect = mock_futures
-        mock_as_completed.return_value = iter(mock_futures)
 
         # Process artists
-        with patch('artist_bio_gen.core.orchestrator.append_jsonl_response'):
+        with patch('artist_bio_gen.core.orchestrator.JsonlWriter'):
             successful, failed = self.orchestrator.process_artists(
                 self.test_artists[:3]
             )
@@ -171,9 +351,8 @@ class TestProcessingOrchestrator(unittest.TestCase):
         self.assertEqual(failed, 1)
 
     @patch('artist_bio_gen.core.orchestrator.ThreadPoolExecutor')
-    @patch('artist_bio_gen.core.orchestrator.as_completed')
     def test_process_artists_with_exception(
-        self, mock_as_completed, mock_executor_class
+        self, mock_executor_class
     ):
         """Test processing with exception during API call."""
         # Setup mock executor
@@ -181,13 +360,12 @@ class TestProcessingOrchestrator(unittest.TestCase):
         mock_executor_class.return_value.__enter__.return_value = mock_executor
 
         # Setup mock future that raises exception
-        mock_future = Mock(spec=Future)
-        mock_future.result.side_effect = Exception("Network error")
-        mock_executor.submit.return_value = mock_future
-        mock_as_completed.return_value = iter([mock_future])
+        mock_executor.submit.return_value = _completed_future(
+            exception=Exception("Network error")
+        )
 
         # Process single artist
-        with patch('artist_bio_gen.core.orchestrator.append_jsonl_response'):
+        with patch('artist_bio_gen.core.orchestrator.JsonlWriter'):
             with patch('artist_bio_gen.core.orchestrator.logger') as mock_logger:
                 successful, failed = self.orchestrator.process_artists(
                     [self.test_artists[0]]
@@ -310,7 +488,88 @@ class TestProcessingOrchestrator(unittest.TestCase):
         # No additional timer should be created
         self.assertEqual(mock_timer_class.call_count, 1)
 
-    def test_submit_tasks_with_pause(self):
+    def test_quota_pause_checked_every_interval(self):
+        """Test quota pause is checked on the first success, then every interval."""
+        orchestrator = ProcessingOrchestrator(
+            context=self.mock_context,
+            prompt_id="test-prompt",
+            version="v1",
+            max_workers=2,
+            quota_check_interval=3,
+        )
+        orchestrator._writer = Mock()
+        artist = self.test_artists[0]
+        response = ApiResponse(
+            artist_id=artist.artist_id,
+            artist_name=artist.name,
+            artist_data=artist.data,
+            response_text="Bio",
+            response_id="resp",
+            created=0,
+        )
+
+        with patch.object(orchestrator, '_check_and_handle_quota_pause') as mock_check, \
+             patch('sys.stdout'):
+            for _ in range(7):
+                orchestrator._handle_response(response, artist, "W01", 1.0, Mock())
+
+        # Successes 1, 4 and 7
+        self.assertEqual(mock_check.call_count, 3)
+
+    def test_print_responses_toggle(self):
+        """Test successful bios are echoed to stdout only when enabled."""
+        artist = self.test_artists[0]
+        response = ApiResponse(
+            artist_id=artist.artist_id,
+            artist_name=artist.name,
+            artist_data=artist.data,
+            response_text="Bio",
+            response_id="resp",
+            created=0,
+        )
+
+        for enabled, expected in ((True, ["Bio\n"]), (False, [])):
+            with self.subTest(print_responses=enabled):
+                orchestrator = ProcessingOrchestrator(
+                    context=self.mock_context,
+                    prompt_id="test-prompt",
+                    version="v1",
+                    max_workers=2,
+                    print_responses=enabled,
+                )
+                orchestrator._writer = Mock()
+                with patch('sys.stdout') as mock_stdout, \
+                     patch.object(orchestrator, '_check_and_handle_quota_pause'):
+                    orchestrator._handle_response(response, artist, "W01", 1.0, Mock())
+                    orchestrator._flush_stdout()
+
+                written = [c.args[0] for c in mock_stdout.write.call_args_list]
+                self.assertEqual(written, expected)
+
+    def test_printed_responses_are_batched(self):
+        """Test echoed bios reach stdout in batches plus a final flush."""
+        artist = self.test_artists[0]
+        response = ApiResponse(
+            artist_id=artist.artist_id,
+            artist_name=artist.name,
+            artist_data=artist.data,
+            response_text="Bio",
+            response_id="resp",
+            created=0,
+        )
+        self.orchestrator._writer = Mock()
+
+        with patch('sys.stdout') as mock_stdout, \
+             patch.object(self.orchestrator, '_check_and_handle_quota_pause'):
+            for _ in range(_STDOUT_BATCH_SIZE + 1):
+                self.orchestrator._handle_response(response, artist, "W01", 1.0, Mock())
+            self.assertEqual(mock_stdout.write.call_count, 1)
+            self.orchestrator._flush_stdout()
+
+        written = [c.args[0] for c in mock_stdout.write.call_args_list]
+        self.assertEqual(written, ["Bio\n" * _STDOUT_BATCH_SIZE, "Bio\n"])
+
+    def test_submit_task_with_pause(self):
         """Test task submission with pause checking."""
         mock_executor = MagicMock()
 
@@ -322,22 +581,53 @@ class TestProcessingOrchestrator(unittest.TestCase):
         self.orchestrator.resource_coordinator = Mock()
 
         # Submit tasks
-        futures = self.orchestrator._submit_tasks(
-            mock_executor, self.test_artists[:2]
-        )
+        submitted = [
+            self.orchestrator._submit_task(mock_executor, i, artist)
+            for i, artist in enumerate(self.test_artists[:2])
+        ]
 
         # Verify pause check was called
         self.assertEqual(
             self.orchestrator.resource_coordinator.wait_if_paused.call_count, 2
         )
 
-        # Verify futures were created
-        self.assertEqual(len(futures), 2)
+        # Verify futures and worker IDs were assigned correctly
+        self.assertEqual([future for future, _ in submitted], mock_futures)
+        self.assertEqual([worker_id for _, worker_id in submitted], ["W01", "W02"])
 
-        # Verify worker IDs were assigned correctly
-        for future, (artist, worker_id) in futures.items():
-            self.assertIn(artist, self.test_artists[:2])
-            self.assertIn(worker_id, ["W01", "W02"])
+    def test_run_bounded_caps_in_flight_tasks(self):
+        """Test no more than 2 * max_workers tasks are in flight."""
+        artists = [
+            ArtistData(artist_id=f"id_{i}", name=f"Artist {i}") for i in range(10)
+        ]
+        lock = threading.Lock()
+        in_flight = 0
+        in_flight_sizes = []
+
+        def submit_task(executor, index, artist):
+            nonlocal in_flight
+            with lock:
+                in_flight += 1
+                in_flight_sizes.append(in_flight)
+            return executor.submit(time.sleep, 0.01), "W01"
+
+        def process_result(future, artist, worker_id, tracker):
+            nonlocal in_flight
+            with lock:
+                in_flight -= 1
+
+        with ThreadPoolExecutor(max_workers=2) as executor, \
+             patch.object(self.orchestrator, '_submit_task', side_effect=submit_task), \
+             patch.object(
+                 self.orchestrator, '_process_result', side_effect=process_result
+             ) as mock_process:
+            self.orchestrator._run_bounded(executor, artists, Mock())
+
+            # Every callback has finished by the time _run_bounded returns
+            self.assertEqual(mock_process.call_count, 10)
+
+        self.assertEqual(len(in_flight_sizes), 10)
+        self.assertLessEqual(max(in_flight_sizes), 4)
 
 
 if __name__ == '__main__':
@@ -181,8 +181,13 @@ class TestPauseResume(unittest.TestCase):
             )
             mock_call_api.return_value = (mock_api_response, 0.1)
 
+            def fire_timer():
+                # Simulate the quota reset elapsing so paused submission resumes
+                args, kwargs = mock_timer_ctor.call_args
+                args[1](*kwargs.get("args", ()))
+
             timer_instance = Mock()
-            timer_instance.start = Mock()
+            timer_instance.start = Mock(side_effect=fire_timer)
             mock_timer_ctor.return_value = timer_instance
 
             resume_values = []
@@ -69,6 +69,21 @@ class TestProcessingResult(unittest.TestCase):
         self.assertEqual(api_response.db_status, "updated")
         self.assertIsNone(api_response.error)
 
+    def test_to_api_response_is_cached_until_invalidated(self):
+        """Test ApiResponse is reused until the result is invalidated."""
+        artist = ArtistData("123", "Test Artist", None)
+        result = ProcessingResult(artist=artist, response_text="Bio text")
+
+        first = result.to_api_response()
+        self.assertIs(result.to_api_response(), first)
+
+        result.db_status = "updated"
+        result.invalidate_api_response()
+        second = result.to_api_response()
+
+        self.assertIsNot(second, first)
+        self.assertEqual(second.db_status, "updated")
+
 
 class TestHeaderExtractionStep(unittest.TestCase):
     """Test HeaderExtractionStep."""
@@ -187,6 +202,18 @@ class TestQuotaUpdateStep(unittest.TestCase):
         # Should not raise error
         result = step.process(result, context)
 
+    def test_skips_update_without_headers_or_usage(self):
+        """Test quota monitor is not consulted when there is nothing to parse."""
+        step = QuotaUpdateStep()
+        artist = ArtistData("123", "Test Artist", None)
+        result = ProcessingResult(artist=artist)
+        quota_monitor = Mock()
+        context = RequestContext(quota_monitor=quota_monitor)
+
+        step.process(result, context)
+
+        quota_monitor.update_from_response.assert_not_called()
+
 
 class TestDatabaseUpdateStep(unittest.TestCase):
     """Test DatabaseUpdateStep."""
@@ -227,6 +254,50 @@ class TestDatabaseUpdateStep(unittest.TestCase):
         )
         mock_release.assert_called_once_with(db_pool, mock_conn)
 
+    @patch('artist_bio_gen.core.pipeline.update_artist_bio')
+    @patch('artist_bio_gen.core.pipeline.get_db_connection')
+    def test_uses_bio_batcher_when_configured(self, mock_get_conn, mock_update):
+        """Test updates go through the group-commit batcher when present."""
+        batcher = Mock()
+        batcher.submit.return_value = Mock(success=True, rows_affected=0)
+
+        step = DatabaseUpdateStep()
+        artist = ArtistData("123", "Test Artist", None)
+        result = ProcessingResult(artist=artist, response_text="Bio text")
+        context = RequestContext(db_pool=Mock(), bio_batcher=batcher, skip_existing=True)
+
+        result = step.process(result, context)
+
+        self.assertEqual(result.db_status, "skipped")
+        batcher.submit.assert_called_once_with(
+            artist_id="123",
+            bio="Bio text",
+            skip_existing=True,
+            test_mode=False,
+            worker_id="main",
+        )
+        mock_get_conn.assert_not_called()
+        mock_update.assert_not_called()
+
+    @patch('artist_bio_gen.core.pipeline.release_db_connection')
+    @patch('artist_bio_gen.core.pipeline.update_artist_bio')
+    @patch('artist_bio_gen.core.pipeline.get_db_connection')
+    def test_reports_connection_wait_to_throttle(self, mock_get_conn, mock_update, mock_release):
+        """Test connection wait time is reported to the throttle."""
+        mock_get_conn.return_value = Mock()
+        mock_update.return_value = Mock(success=True, rows_affected=1)
+
+        step = DatabaseUpdateStep()
+        artist = ArtistData("123", "Test Artist", None)
+        result = ProcessingResult(artist=artist, response_text="Bio text")
+        throttle = Mock()
+        context = RequestContext(db_pool=Mock(), throttle=throttle)
+
+        step.process(result, context)
+
+        throttle.record_wait.assert_called_once()
+        self.assertGreaterEqual(throttle.record_wait.call_args[0][0], 0.0)
+
     @patch('artist_bio_gen.core.pipeline.release_db_connection')
     @patch('artist_bio_gen.core.pipeline.get_db_connection')
     def test_database_connection_failure(self, mock_get_conn, mock_release):
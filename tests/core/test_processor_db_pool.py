@@ -44,7 +44,7 @@ class TestProcessorDbPool(unittest.TestCase):
         artists = _make_artists(4)
         pool = FakePool()
 
-        def fake_call_openai_api(client, artist, prompt_id, version, worker_id, db_pool, skip_existing, test_mode, quota_monitor=None, pause_controller=None, output_path=None):
+        def fake_call_openai_api(client, artist, prompt_id, version, worker_id, db_pool, skip_existing, test_mode, quota_monitor=None, pause_controller=None, output_path=None, throttle=None, bio_batcher=None):
             # Simulate the new behavior where call_openai_api acquires and releases connections
             if db_pool is not None:
                 conn = db_pool.getconn()  # Simulate getting connection
@@ -96,7 +96,7 @@ class TestProcessorDbPool(unittest.TestCase):
         artists = _make_artists(3)
         pool = FakePool()
 
-        def fake_call_openai_api_fail(client, artist, prompt_id, version, worker_id, db_pool, skip_existing, test_mode, quota_monitor=None, pause_controller=None, output_path=None):
+        def fake_call_openai_api_fail(client, artist, prompt_id, version, worker_id, db_pool, skip_existing, test_mode, quota_monitor=None, pause_controller=None, output_path=None, throttle=None, bio_batcher=None):
             # Simulate the new behavior where call_openai_api acquires and releases connections
             # even when an error occurs later in the function
             if db_pool is not None:
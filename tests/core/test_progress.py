@@ -6,6 +6,7 @@ import unittest
 from unittest.mock import patch, Mock
 import time
 import logging
+import threading
 
 from artist_bio_gen.core.progress import ProgressTracker, BatchProgressReporter
 
@@ -57,6 +58,62 @@ class TestProgressTracker(unittest.TestCase):
             # Check that warning log was called for failure
             mock_logger.warning.assert_called()
 
+    def test_sampled_item_logging(self):
+        """Test successes are only logged when a summary is due without log_every_item."""
+        tracker = ProgressTracker(total_items=100, log_every_item=False)
+
+        with patch('artist_bio_gen.core.progress.logger') as mock_logger:
+            for _ in range(9):
+                tracker.update(True, "Artist", 0.1, "W01")
+            mock_logger.info.assert_not_called()
+
+            tracker.update(False, "Failed Artist", 0.1, "W01")
+            mock_logger.warning.assert_called_once()
+
+            # The 10th completion reaches the 10% interval
+            tracker.update(True, "Artist", 0.1, "W01")
+            self.assertEqual(mock_logger.info.call_count, 1)
+
+    def test_concurrent_updates_are_counted_exactly(self):
+        """Test updates from many threads are never lost."""
+        tracker = ProgressTracker(total_items=800)
+
+        def worker(success):
+            for _ in range(100):
+                tracker.update(success, "Artist", 0.0, "W01")
+
+        with patch('artist_bio_gen.core.progress.logger'):
+            threads = [
+                threading.Thread(target=worker, args=(i % 2 == 0,)) for i in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(tracker.get_stats(), (400, 400))
+
+    def test_concurrent_summaries_record_consistent_log_state(self):
+        """Test summaries logged from many threads track the final count."""
+        tracker = ProgressTracker(total_items=800)
+
+        def worker():
+            for _ in range(100):
+                tracker.update(True, "Artist", 0.0, "W01")
+                if tracker.should_log_summary():
+                    tracker.log_summary()
+
+        with patch('artist_bio_gen.core.progress.logger'):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            tracker.log_summary()
+
+        self.assertEqual(tracker.get_stats(), (800, 0))
+        self.assertEqual(tracker.last_logged_count, 800)
+
     def test_should_log_summary_interval(self):
         """Test summary logging based on interval."""
         # Should not log initially
@@ -9,6 +9,7 @@ import tempfile
 import os
 
 from artist_bio_gen.core.resources import (
+    ConcurrencyThrottle,
     ProcessingContext,
     OutputManager,
     TimerManager,
@@ -75,6 +76,25 @@ class TestProcessingContext(unittest.TestCase):
             self.assertIsNotNone(context.pause_controller)
             self.assertTrue(context.output_initialized)
 
+    def test_context_exit_flushes_and_closes_jsonl_writer(self):
+        """Test queued output records are on disk once the context exits."""
+        context = ProcessingContext(
+            client=self.mock_client,
+            output_path=self.output_path,
+            quota_monitoring=False,
+        )
+
+        with context:
+            writer = context.jsonl_writer
+            self.assertIsNotNone(writer)
+            writer.put(b'{"artist_id": "a"}\n')
+
+        self.assertIsNone(context.jsonl_writer)
+        with self.assertRaises(ValueError):
+            writer.put(b'{"artist_id": "b"}\n')
+        with open(self.output_path, "rb") as f:
+            self.assertEqual(f.read(), b'{"artist_id": "a"}\n')
+
     @patch('artist_bio_gen.core.resources.initialize_jsonl_output')
     def test_context_without_quota_monitoring(self, mock_init_output):
         """Test context initialization without quota monitoring."""
@@ -129,6 +149,86 @@ class TestProcessingContext(unittest.TestCase):
         self.assertEqual(message, "")
 
 
+class TestConcurrencyThrottle(unittest.TestCase):
+    """Test cases for ConcurrencyThrottle class."""
+
+    def test_context_creates_throttle_with_db_pool(self):
+        """Test throttle is only created for per-row writes with a DB pool."""
+        with_pool = ProcessingContext(
+            client=Mock(), output_path="/tmp/x.jsonl", db_pool=Mock(), max_workers=4,
+            db_batch_size=1,
+        )
+        without_pool = ProcessingContext(
+            client=Mock(), output_path="/tmp/x.jsonl", max_workers=4
+        )
+
+        batched = ProcessingContext(
+            client=Mock(), output_path="/tmp/x.jsonl", db_pool=Mock(), max_workers=4,
+            db_batch_size=50,
+        )
+
+        self.assertEqual(with_pool.throttle.limit, 4)
+        self.assertIsNone(without_pool.throttle)
+        self.assertIsNone(batched.throttle)
+
+    def test_sheds_permit_on_slow_waits(self):
+        """Test limit drops when p95 wait exceeds the threshold."""
+        throttle = ConcurrencyThrottle(4, wait_threshold=0.05, window_size=8)
+
+        for _ in range(8):
+            throttle.record_wait(0.2)
+
+        self.assertEqual(throttle.limit, 3)
+
+    def test_p95_uses_nearest_rank(self):
+        """Test p95 of a small window is its slowest sample, not p75."""
+        throttle = ConcurrencyThrottle(4, wait_threshold=0.05, window_size=4)
+
+        for wait in (0.03, 0.03, 0.03, 0.2):
+            throttle.record_wait(wait)
+
+        self.assertEqual(throttle.limit, 3)
+
+    def test_never_sheds_below_one(self):
+        """Test limit never drops below a single permit."""
+        throttle = ConcurrencyThrottle(2, wait_threshold=0.05, window_size=4)
+
+        for _ in range(40):
+            throttle.record_wait(1.0)
+
+        self.assertEqual(throttle.limit, 1)
+
+    def test_restores_permit_on_fast_waits(self):
+        """Test limit recovers once waits drop."""
+        throttle = ConcurrencyThrottle(4, wait_threshold=0.05, window_size=4)
+        for _ in range(4):
+            throttle.record_wait(0.2)
+        self.assertEqual(throttle.limit, 3)
+
+        for _ in range(4):
+            throttle.record_wait(0.001)
+
+        self.assertEqual(throttle.limit, 4)
+
+    def test_acquire_blocks_at_limit(self):
+        """Test acquire blocks until a permit is released."""
+        throttle = ConcurrencyThrottle(1)
+        throttle.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            throttle.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+
+        throttle.release()
+        self.assertTrue(acquired.wait(1.0))
+        thread.join()
+
+
 class TestOutputManager(unittest.TestCase):
     """Test cases for OutputManager class."""
 
@@ -89,6 +89,25 @@ class TestResumeFunctionality(unittest.TestCase):
         finally:
             os.unlink(jsonl_path)
             
+    def test_get_processed_artist_ids_without_orjson(self):
+        """Test the stdlib fallback reads the same IDs from non-ASCII output."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False, encoding='utf-8') as f:
+            f.write(json.dumps({
+                "artist_id": "11111111-1111-1111-1111-111111111111",
+                "artist_name": "Björk",
+                "response_text": "Icelandic singer – songwriter"
+            }, ensure_ascii=False) + "\n")
+            jsonl_path = f.name
+
+        try:
+            with patch('artist_bio_gen.core.output.orjson', None):
+                processed_ids = get_processed_artist_ids(jsonl_path)
+
+            self.assertEqual(processed_ids, {"11111111-1111-1111-1111-111111111111"})
+
+        finally:
+            os.unlink(jsonl_path)
+
     def test_parse_input_file_with_skip_processed(self):
         """Test input parsing with skip processed IDs."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
@@ -13,9 +13,12 @@ from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 from artist_bio_gen.core.output import (
+    JsonlWriter,
     append_jsonl_response, 
+    serialize_jsonl_response,
     initialize_jsonl_output,
     get_processed_artist_ids,
+    write_jsonl_output,
     _create_jsonl_record
 )
 from artist_bio_gen.models import ApiResponse
@@ -218,6 +221,40 @@ class TestStreamingOutput(unittest.TestCase):
         finally:
             os.unlink(output_path)
             
+    def test_concurrent_append_of_mixed_length_lines(self):
+        """Test short and multi-KB records appended concurrently never interleave."""
+        bios = ["short bio", "x" * 6000, "y" * 70000]
+        responses = [
+            ApiResponse(
+                artist_id=f"{i:08d}-1111-1111-1111-111111111111",
+                artist_name=f"Artist {i}",
+                artist_data=None,
+                response_text=bios[i % len(bios)],
+                response_id=f"resp_{i}",
+                created=1693843200,
+            )
+            for i in range(60)
+        ]
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            output_path = f.name
+            
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for response in responses:
+                    executor.submit(append_jsonl_response, response, output_path, "prompt_123")
+                    
+            with open(output_path, 'r') as f:
+                records = [json.loads(line) for line in f]
+                
+            self.assertEqual(len(records), 60)
+            for record in records:
+                i = int(record["response_id"].split("_")[1])
+                self.assertEqual(record["response_text"], bios[i % len(bios)])
+            
+        finally:
+            os.unlink(output_path)
+            
     def test_append_with_error_response(self):
         """Test appending responses that contain errors."""
         error_response = ApiResponse(
@@ -338,5 +375,159 @@ class TestStreamingOutput(unittest.TestCase):
             os.unlink(output_path)
 
 
+class TestJsonlWriter(unittest.TestCase):
+    """Test the batched JSONL writer thread."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_path = os.path.join(self.temp_dir.name, "out", "results.jsonl")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def _response(self, i):
+        return ApiResponse(
+            artist_id=f"id_{i}",
+            artist_name=f"Artist {i}",
+            artist_data=None,
+            response_text=f"Bio {i}",
+            response_id=f"resp_{i}",
+            created=1693843200,
+            db_status="null",
+        )
+
+    def test_writes_all_records_matching_append_format(self):
+        """Test writer output is line-for-line identical to append_jsonl_response."""
+        expected_path = os.path.join(self.temp_dir.name, "expected.jsonl")
+        responses = [self._response(i) for i in range(300)]
+
+        with JsonlWriter(self.output_path) as writer:
+            for response in responses:
+                writer.write_response(response, "prompt_123", "v1")
+        for response in responses:
+            append_jsonl_response(response, expected_path, "prompt_123", "v1")
+
+        with open(self.output_path, encoding="utf-8") as f:
+            written = f.read()
+        with open(expected_path, encoding="utf-8") as f:
+            expected = f.read()
+
+        self.assertEqual(written, expected)
+        self.assertEqual(writer.lines_written, 300)
+
+    def test_bulk_write_matches_streamed_format(self):
+        """Test write_jsonl_output emits the same bytes as the streaming path."""
+        bulk_path = os.path.join(self.temp_dir.name, "bulk.jsonl")
+        expected_path = os.path.join(self.temp_dir.name, "expected.jsonl")
+        responses = [self._response(i) for i in range(5)]
+
+        write_jsonl_output(responses, bulk_path, "prompt_123", "v1")
+        for response in responses:
+            append_jsonl_response(response, expected_path, "prompt_123", "v1")
+
+        with open(bulk_path, "rb") as f:
+            written = f.read()
+        with open(expected_path, "rb") as f:
+            self.assertEqual(written, f.read())
+
+    def test_appends_to_existing_file(self):
+        """Test writer appends rather than truncating."""
+        append_jsonl_response(self._response(0), self.output_path, "prompt_123")
+
+        with JsonlWriter(self.output_path) as writer:
+            writer.write_response(self._response(1), "prompt_123")
+
+        with open(self.output_path, encoding="utf-8") as f:
+            ids = [json.loads(line)["artist_id"] for line in f]
+        self.assertEqual(ids, ["id_0", "id_1"])
+
+    def test_concurrent_producers(self):
+        """Test lines from many threads are written whole."""
+        with JsonlWriter(self.output_path) as writer:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for i in range(200):
+                    executor.submit(writer.write_response, self._response(i), "prompt_123")
+
+        with open(self.output_path, encoding="utf-8") as f:
+            ids = {json.loads(line)["artist_id"] for line in f}
+        self.assertEqual(len(ids), 200)
+
+    def test_responses_are_serialized_on_writer_thread(self):
+        """Test write_response defers serialization to the writer thread."""
+        threads = []
+
+        def recording_serialize(response, prompt_id, version=None):
+            threads.append(threading.current_thread().name)
+            return serialize_jsonl_response(response, prompt_id, version)
+
+        with patch('artist_bio_gen.core.output.serialize_jsonl_response', side_effect=recording_serialize):
+            with JsonlWriter(self.output_path) as writer:
+                for i in range(3):
+                    writer.write_response(self._response(i), "prompt_123")
+
+        self.assertEqual(threads, ["jsonl-writer"] * 3)
+        self.assertEqual(writer.lines_written, 3)
+
+    def test_bounded_queue_applies_backpressure_without_loss(self):
+        """Test producers block on a full queue and every record still lands."""
+        with patch('artist_bio_gen.core.output._WRITER_QUEUE_SIZE', 1):
+            with JsonlWriter(self.output_path) as writer:
+                self.assertEqual(writer._queue.maxsize, 1)
+                for i in range(300):
+                    writer.write_response(self._response(i), "prompt_123")
+
+        with open(self.output_path, encoding="utf-8") as f:
+            ids = [json.loads(line)["artist_id"] for line in f]
+        self.assertEqual(ids, [f"id_{i}" for i in range(300)])
+
+    def test_put_after_close_raises(self):
+        """Test writes after close are rejected."""
+        writer = JsonlWriter(self.output_path)
+        writer.close()
+        writer.close()  # idempotent
+
+        with self.assertRaises(ValueError):
+            writer.write_response(self._response(0), "prompt_123")
+
+
+class TestJsonlSerialization(unittest.TestCase):
+    """Test JSONL line encoding with and without orjson."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.response = ApiResponse(
+            artist_id="id_1",
+            artist_name="Björk",
+            artist_data="Icelandic — singer",
+            response_text="Bio with “quotes”",
+            response_id="resp_1",
+            created=1693843200,
+            db_status="updated",
+        )
+
+    def test_stdlib_fallback_is_compact_utf8(self):
+        """Test the stdlib fallback emits compact, unescaped UTF-8."""
+        with patch("artist_bio_gen.core.output.orjson", None):
+            line = serialize_jsonl_response(self.response, "prompt_123", "v1")
+
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertNotIn(b", ", line)
+        self.assertIn("Björk".encode("utf-8"), line)
+        self.assertEqual(
+            json.loads(line),
+            _create_jsonl_record(self.response, "prompt_123", "v1"),
+        )
+
+    def test_encoders_produce_same_record(self):
+        """Test orjson (when installed) and the fallback decode identically."""
+        line = serialize_jsonl_response(self.response, "prompt_123")
+        with patch("artist_bio_gen.core.output.orjson", None):
+            fallback = serialize_jsonl_response(self.response, "prompt_123")
+
+        self.assertEqual(json.loads(line), json.loads(fallback))
+
+
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
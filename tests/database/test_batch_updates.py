@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Tests for batched (group-commit) bio updates.
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from artist_bio_gen.database import BioUpdateBatcher, update_artist_bios_batch
+from artist_bio_gen.models import DatabaseResult
+
+ID_1 = "11111111-1111-1111-1111-111111111111"
+ID_2 = "22222222-2222-2222-2222-222222222222"
+ID_3 = "33333333-3333-3333-3333-333333333333"
+
+
+class TestUpdateArtistBiosBatch(unittest.TestCase):
+    """Test the single-statement batch update."""
+
+    def test_single_statement_and_commit(self):
+        """Test a batch runs one statement and one commit."""
+        connection = MagicMock()
+        cursor = connection.cursor.return_value
+        cursor.fetchall.return_value = [(ID_1,), (ID_2.upper(),)]
+
+        updated = update_artist_bios_batch(
+            connection, [(ID_1, "Bio 1"), (ID_2, "Bio 2"), (ID_3, "Bio 3")]
+        )
+
+        self.assertEqual(updated, {ID_1, ID_2})
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args[0]
+        self.assertIn("UPDATE artists AS t", sql)
+        self.assertIn("RETURNING t.id", sql)
+        self.assertNotIn("bio IS NULL", sql)
+        self.assertEqual(params, ([ID_1, ID_2, ID_3], ["Bio 1", "Bio 2", "Bio 3"]))
+        connection.commit.assert_called_once()
+
+    def test_skip_existing_and_test_mode(self):
+        """Test skip_existing and test_mode shape the statement."""
+        connection = MagicMock()
+        connection.cursor.return_value.fetchall.return_value = []
+
+        update_artist_bios_batch(
+            connection, [(ID_1, "Bio")], skip_existing=True, test_mode=True
+        )
+
+        sql = connection.cursor.return_value.execute.call_args[0][0]
+        self.assertIn("UPDATE test_artists AS t", sql)
+        self.assertIn("AND t.bio IS NULL", sql)
+
+    def test_rolls_back_and_raises(self):
+        """Test failures roll back and propagate."""
+        connection = MagicMock()
+        connection.cursor.return_value.execute.side_effect = Exception(
+            "deadlock detected"
+        )
+
+        with self.assertRaises(Exception):
+            update_artist_bios_batch(connection, [(ID_1, "Bio")])
+
+        connection.rollback.assert_called_once()
+        connection.commit.assert_not_called()
+
+    def test_empty_batch(self):
+        """Test empty batches never touch the connection."""
+        connection = MagicMock()
+
+        self.assertEqual(update_artist_bios_batch(connection, []), set())
+        connection.cursor.assert_not_called()
+
+
+@patch("artist_bio_gen.database.batch.release_db_connection")
+@patch("artist_bio_gen.database.batch.get_db_connection")
+class TestBioUpdateBatcher(unittest.TestCase):
+    """Test the group-commit batcher."""
+
+    def _submit_concurrently(self, batcher, artist_ids):
+        results = {}
+
+        def worker(artist_id):
+            results[artist_id] = batcher.submit(artist_id, f"Bio {artist_id}")
+
+        threads = [threading.Thread(target=worker, args=(a,)) for a in artist_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    @patch("artist_bio_gen.database.batch.update_artist_bios_batch")
+    def test_groups_concurrent_updates(self, mock_batch, mock_get_conn, mock_release):
+        """Test concurrent submissions share one transaction and get per-row results."""
+        mock_batch.return_value = {ID_1, ID_2}
+
+        with BioUpdateBatcher(MagicMock(), batch_size=10, linger=0.5) as batcher:
+            results = self._submit_concurrently(batcher, [ID_1, ID_2, ID_3])
+
+        mock_batch.assert_called_once()
+        self.assertEqual(len(mock_batch.call_args[0][1]), 3)
+        mock_release.assert_called_once()
+        self.assertEqual(results[ID_1].rows_affected, 1)
+        self.assertEqual(results[ID_2].rows_affected, 1)
+        self.assertEqual(results[ID_3].rows_affected, 0)
+        self.assertTrue(all(r.success for r in results.values()))
+
+    @patch("artist_bio_gen.database.batch.update_artist_bios_batch")
+    def test_respects_batch_size(self, mock_batch, mock_get_conn, mock_release):
+        """Test batches never exceed batch_size rows."""
+        mock_batch.return_value = set()
+        ids = [f"{i:08d}-0000-0000-0000-000000000000" for i in range(5)]
+
+        with BioUpdateBatcher(MagicMock(), batch_size=2, linger=0.2) as batcher:
+            self._submit_concurrently(batcher, ids)
+
+        sizes = [len(call[0][1]) for call in mock_batch.call_args_list]
+        self.assertEqual(sum(sizes), 5)
+        self.assertLessEqual(max(sizes), 2)
+
+    @patch("artist_bio_gen.database.batch.update_artist_bios_batch")
+    def test_permanent_error_fails_batch(self, mock_batch, mock_get_conn, mock_release):
+        """Test permanent errors are reported to every row without retrying."""
+        mock_batch.side_effect = Exception("relation does not exist")
+
+        with BioUpdateBatcher(MagicMock(), linger=0.0) as batcher:
+            result = batcher.submit(ID_1, "Bio")
+
+        self.assertFalse(result.success)
+        self.assertIn("permanent", result.error)
+        mock_batch.assert_called_once()
+
+    @patch("artist_bio_gen.database.batch.update_artist_bio")
+    @patch("artist_bio_gen.database.batch.update_artist_bios_batch")
+    def test_permanent_error_falls_back_to_per_row(
+        self, mock_batch, mock_update, mock_get_conn, mock_release
+    ):
+        """Test a permanent batch error isolates the bad row."""
+        mock_batch.side_effect = Exception("check constraint violated")
+
+        def update(connection, artist_id, bio, **kwargs):
+            if artist_id == ID_2:
+                return DatabaseResult(
+                    success=False, rows_affected=0, error="check constraint"
+                )
+            return DatabaseResult(success=True, rows_affected=1, error=None)
+
+        mock_update.side_effect = update
+
+        with BioUpdateBatcher(MagicMock(), batch_size=10, linger=0.5) as batcher:
+            results = self._submit_concurrently(batcher, [ID_1, ID_2, ID_3])
+
+        mock_batch.assert_called_once()
+        self.assertEqual(mock_update.call_count, 3)
+        self.assertTrue(results[ID_1].success)
+        self.assertFalse(results[ID_2].success)
+        self.assertTrue(results[ID_3].success)
+
+    @patch("artist_bio_gen.database.batch.update_artist_bios_batch")
+    def test_crashed_thread_fails_pending_rows(
+        self, mock_batch, mock_get_conn, mock_release
+    ):
+        """Test workers are released with an error if the batcher thread dies."""
+        batcher = BioUpdateBatcher(MagicMock(), linger=0.0)
+
+        with patch.object(batcher, "_commit", side_effect=RuntimeError("boom")):
+            result = batcher.submit(ID_1, "Bio")
+            batcher._thread.join(timeout=5)
+
+        self.assertFalse(result.success)
+        self.assertIn("boom", result.error)
+        self.assertFalse(batcher._thread.is_alive())
+        self.assertFalse(batcher.submit(ID_2, "Bio").success)
+        batcher.close()
+
+    @patch("artist_bio_gen.database.batch.update_artist_bios_batch")
+    def test_transient_error_is_retried(self, mock_batch, mock_get_conn, mock_release):
+        """Test transient errors are retried on a fresh connection."""
+        mock_batch.side_effect = [Exception("connection reset"), {ID_1}]
+
+        with BioUpdateBatcher(MagicMock(), linger=0.0, retry_delay=0.0) as batcher:
+            result = batcher.submit(ID_1, "Bio")
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.rows_affected, 1)
+        self.assertEqual(mock_batch.call_count, 2)
+        self.assertEqual(mock_release.call_count, 2)
+
+    def test_invalid_uuid_rejected_without_queueing(self, mock_get_conn, mock_release):
+        """Test invalid IDs fail immediately without touching the database."""
+        with BioUpdateBatcher(MagicMock()) as batcher:
+            result = batcher.submit("not-a-uuid", "Bio")
+
+        self.assertFalse(result.success)
+        self.assertIn("Invalid UUID", result.error)
+        mock_get_conn.assert_not_called()
+
+    def test_submit_after_close(self, mock_get_conn, mock_release):
+        """Test submissions after close fail instead of hanging."""
+        batcher = BioUpdateBatcher(MagicMock())
+        batcher.close()
+
+        result = batcher.submit(ID_1, "Bio")
+
+        self.assertFalse(result.success)
+
+
+if __name__ == "__main__":
+    unittest.main()
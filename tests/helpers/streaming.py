@@ -26,7 +26,8 @@ def create_streaming_mock(original_mock):
     def streaming_wrapper(*args, **kwargs):
         # call_openai_api signature:
         # (client, artist, prompt_id, version, worker_id, db_pool,
-        #  skip_existing, test_mode, quota_monitor, pause_controller, output_path)
+        #  skip_existing, test_mode, quota_monitor, pause_controller, output_path,
+        #  throttle, bio_batcher)
         # output_path is the 11th positional argument (index 10)
 
         # Get output_path from positional args or kwargs
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-artist record models.
+
+ArtistData and ApiResponse are allocated at least once per artist, so they
+stay lightweight immutable tuples; updates such as setting db_status go
+through _replace() and must never mutate a shared instance.
+"""
+
+import unittest
+
+from artist_bio_gen.models import ApiResponse, ArtistData
+
+ARTIST_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def _make_response(**overrides):
+    fields = dict(
+        artist_id=ARTIST_ID,
+        artist_name="Artist",
+        artist_data=None,
+        response_text="Bio",
+        response_id="resp_1",
+        created=0,
+    )
+    fields.update(overrides)
+    return ApiResponse(**fields)
+
+
+class TestRecordModels(unittest.TestCase):
+    """Test that per-artist records are immutable, dict-free tuples."""
+
+    def test_artist_data_is_an_immutable_tuple(self):
+        """Test ArtistData carries no __dict__ and rejects attribute writes."""
+        artist = ArtistData(artist_id=ARTIST_ID, name="Artist", data=None)
+
+        self.assertIsInstance(artist, tuple)
+        self.assertFalse(hasattr(artist, "__dict__"))
+        with self.assertRaises(AttributeError):
+            artist.name = "changed"
+
+    def test_api_response_is_an_immutable_tuple(self):
+        """Test ApiResponse carries no __dict__ and rejects attribute writes."""
+        response = _make_response(error="boom")
+
+        self.assertIsInstance(response, tuple)
+        self.assertFalse(hasattr(response, "__dict__"))
+        with self.assertRaises(AttributeError):
+            response.error = "changed"
+
+    def test_replace_leaves_the_original_response_untouched(self):
+        """Test db_status updates produce a new record, as cached responses rely on."""
+        cached = _make_response()
+
+        updated = cached._replace(db_status="updated")
+
+        self.assertIsInstance(updated, ApiResponse)
+        self.assertEqual(updated.db_status, "updated")
+        self.assertIsNone(cached.db_status)
+        self.assertEqual(updated._replace(db_status=None), cached)
+
+
+if __name__ == "__main__":
+    unittest.main()
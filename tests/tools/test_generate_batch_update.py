@@ -1296,5 +1296,47 @@ class TestSQLGeneration(unittest.TestCase):
             os.rmdir(temp_dir)
 
 
+class TestJsonlWriterRoundTrip(unittest.TestCase):
+    """Test the batch update tool consumes JSONL written by the processor."""
+
+    def test_writer_output_parses(self):
+        """Test compact, binary-mode JSONL lines round-trip through parse_jsonl_file."""
+        from artist_bio_gen.core.output import JsonlWriter, append_jsonl_response
+        from artist_bio_gen.models import ApiResponse
+
+        ok_id = "123e4567-e89b-12d3-a456-426614174000"
+        appended_id = "a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a11"
+        failed_id = "00000000-0000-0000-0000-000000000000"
+
+        def response(artist_id, text, error=None):
+            return ApiResponse(
+                artist_id=artist_id,
+                artist_name="Björk",
+                artist_data="Icelandic — singer",
+                response_text=text,
+                response_id="resp_1",
+                created=1693843200,
+                db_status="updated",
+                error=error,
+            )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "out.jsonl")
+            with JsonlWriter(output_path) as writer:
+                writer.write_response(response(ok_id, "Bio with “quotes”\nand a newline"), "prompt_123", "v1")
+                writer.write_response(response(failed_id, "", error="API Error"), "prompt_123")
+            append_jsonl_response(response(appended_id, "Appended bio"), output_path, "prompt_123")
+
+            valid, invalid, errors, stats = parse_jsonl_file(output_path)
+
+        self.assertEqual(stats["json_decode_errors"], 0)
+        self.assertEqual(stats["total_lines_processed"], 3)
+        self.assertEqual(
+            [(entry["artist_id"], entry["response_text"]) for entry in valid],
+            [(ok_id, "Bio with “quotes”\nand a newline"), (appended_id, "Appended bio")],
+        )
+        self.assertEqual([entry["artist_id"] for entry in invalid], [failed_id])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,7 @@ import sys
 import tempfile
 import time
 import unittest
+from datetime import datetime, timedelta
 from io import StringIO
 from unittest.mock import patch, MagicMock
 
@@ -44,6 +45,7 @@ from artist_bio_gen.core import (
     log_processing_summary,
     log_progress_update,
 )
+from artist_bio_gen.core.processor import format_duration, format_timestamp
 
 # Import CLI main function
 from artist_bio_gen.cli import (
@@ -99,6 +101,32 @@ class TestProcessingStats(unittest.TestCase):
             stats.total_artists = 20
 
 
+class TestTimeFormatting(unittest.TestCase):
+    """Test cached summary time formatting."""
+
+    def test_format_duration_matches_timedelta(self):
+        """Test durations render exactly like str(timedelta)."""
+        for seconds in (0, 59.9, 61, 3600, 86399, 86400, 90061, 2 * 86400 + 5, -5):
+            with self.subTest(seconds=seconds):
+                self.assertEqual(
+                    format_duration(seconds), str(timedelta(seconds=int(seconds)))
+                )
+
+    def test_format_timestamp_matches_datetime(self):
+        """Test timestamps render like datetime.fromtimestamp().strftime()."""
+        timestamp = 1693843200.75
+        self.assertEqual(
+            format_timestamp(timestamp),
+            datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+    def test_stats_carry_formatted_strings(self):
+        """Test calculate_processing_stats precomputes the summary strings."""
+        stats = calculate_processing_stats(10, 9, 1, 0, 0, 1000.0, 4725.5)
+        self.assertEqual(stats.total_duration_str, "1:02:05")
+        self.assertEqual(stats.end_time_str, format_timestamp(4725.5))
+
+
 class TestProgressBar(unittest.TestCase):
     """Test cases for the progress bar functionality."""
 
@@ -127,6 +155,11 @@ class TestProgressBar(unittest.TestCase):
         self.assertGreater(filled_chars, 0)
         self.assertLess(filled_chars, 30)
 
+    def test_progress_bar_custom_width_and_overflow(self):
+        """Test non-default widths render and overshoot is clamped."""
+        self.assertEqual(create_progress_bar(1, 2, width=4), "[██░░]")
+        self.assertEqual(create_progress_bar(12, 10), create_progress_bar(10, 10))
+
     def test_progress_bar_zero_total(self):
         """Test progress bar with zero total."""
         bar = create_progress_bar(0, 0)
@@ -189,6 +222,20 @@ class TestStatisticsCalculation(unittest.TestCase):
 
         self.assertEqual(stats.avg_time_per_artist, 0.0)
         self.assertEqual(stats.api_calls_per_second, 0.0)
+        self.assertEqual(stats.success_rate, 0.0)
+        self.assertIsNone(stats.processing_efficiency)
+        self.assertIsNone(stats.estimated_total_time)
+
+    def test_calculate_processing_stats_derived_metrics(self):
+        """Test summary metrics are computed once, from actual failures."""
+        # 10 artists, 6 succeeded, 2 failed, 2 never completed (interrupted)
+        stats = calculate_processing_stats(10, 6, 2, 0, 0, 1000.0, 1010.0)
+
+        self.assertEqual(stats.success_rate, 60.0)
+        self.assertEqual(stats.processing_efficiency, 60.0)
+        self.assertEqual(stats.successful_time, 6.0)
+        self.assertEqual(stats.failed_time, 2.0)
+        self.assertEqual(stats.estimated_total_time, 10.0)
 
 
 class TestLoggingFunctions(unittest.TestCase):
@@ -235,7 +282,8 @@ class TestLoggingFunctions(unittest.TestCase):
         log_progress_update(5, 10, "Taylor Swift", True, 2.5)
 
         mock_logger.info.assert_called_once()
-        log_message = mock_logger.info.call_args[0][0]
+        log_args = mock_logger.info.call_args[0]
+        log_message = log_args[0] % log_args[1:]
 
         # Check for key elements in the log message
         self.assertIn("5/ 10", log_message)  # Note the space padding
@@ -245,13 +293,25 @@ class TestLoggingFunctions(unittest.TestCase):
         self.assertIn("SUCCESS", log_message)
         self.assertIn("2.50s", log_message)
 
+    @patch("artist_bio_gen.core.processor.logger")
+    def test_log_progress_update_skipped_when_info_disabled(self, mock_logger):
+        """Test no formatting or logging happens when INFO is disabled."""
+        mock_logger.isEnabledFor.return_value = False
+
+        with patch("artist_bio_gen.core.processor.create_progress_bar") as mock_bar:
+            log_progress_update(5, 10, "Taylor Swift", True, 2.5)
+
+        mock_bar.assert_not_called()
+        mock_logger.info.assert_not_called()
+
     @patch("artist_bio_gen.core.processor.logger")
     def test_log_progress_update_failure(self, mock_logger):
         """Test logging progress update for failed processing."""
         log_progress_update(3, 10, "Drake", False, 1.2)
 
         mock_logger.info.assert_called_once()
-        log_message = mock_logger.info.call_args[0][0]
+        log_args = mock_logger.info.call_args[0]
+        log_message = log_args[0] % log_args[1:]
 
         # Check for key elements in the log message
         self.assertIn("3/ 10", log_message)  # Note the space padding
@@ -309,6 +369,29 @@ class TestLoggingConfiguration(unittest.TestCase):
         setup_logging(verbose=True)
         # If we get here without error, the function works
 
+    def test_setup_logging_writes_through_queue_listener(self):
+        """Test records are enqueued and written to stderr by the listener."""
+        import logging
+        import logging.handlers
+        from artist_bio_gen.utils import logging as logging_utils
+
+        root = logging.getLogger()
+        stderr = StringIO()
+        with patch.object(root, 'handlers', []), \
+             patch.object(root, 'level', root.level), \
+             patch('sys.stderr', stderr), \
+             patch('artist_bio_gen.utils.logging.atexit.register'):
+            setup_logging(verbose=False)
+            listener = logging_utils._queue_listener
+            try:
+                self.assertEqual(len(root.handlers), 1)
+                self.assertIsInstance(root.handlers[0], logging.handlers.QueueHandler)
+                logging.getLogger("artist_bio_gen.test").info("queued %s", "message")
+            finally:
+                listener.stop()
+
+        self.assertIn("INFO - queued message", stderr.getvalue())
+
 
 class TestEnhancedMainFunction(unittest.TestCase):
     """Test cases for the enhanced main function with logging."""